@@ -48,7 +48,7 @@ class HelpAllAction(argparse._HelpAction):
       parser.exit()
 
 def setupSimulation():
-   utils.simulation = True
+   utils.setSimulation(True)
    assert utils.inSimulation()
 
    logging.info('Running in simulation mode')
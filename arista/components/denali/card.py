@@ -202,8 +202,14 @@ class DenaliCard(Card):
 
    def updateAsicAddr(self):
       self.plxDownstreamBus = readSecondaryBus(self.slot.pci)
+      changed = False
       for asicId, asic in enumerate(self.asics):
-         self.asics[asicId].addr = self.getAsicPciAddr(asicId, asic)
+         addr = self.getAsicPciAddr(asicId, asic)
+         if addr != asic.addr:
+            asic.addr = addr
+            changed = True
+      if changed:
+         self.asicAddrEpoch += 1
 
 class DenaliCardSlot(CardSlot):
 
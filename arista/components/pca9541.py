@@ -22,6 +22,7 @@ class Pca9541(I2cComponent):
       driverCls = Pca9541I2cDevDriver if driverMode == 'user' else \
                   Pca9541KernelDriver
       super(Pca9541, self).__init__(addr=addr, driverCls=driverCls, **kwargs)
+      self.i2cAddrs = {}
 
    def takeOwnership(self):
       return self.driver.takeOwnership()
@@ -33,4 +34,7 @@ class Pca9541(I2cComponent):
       return self.driver.getBus()
 
    def i2cAddr(self, addr):
-      return PcaI2cAddr(self, addr)
+      i2cAddr = self.i2cAddrs.get(addr)
+      if i2cAddr is None:
+         i2cAddr = self.i2cAddrs[addr] = PcaI2cAddr(self, addr)
+      return i2cAddr
@@ -3,6 +3,7 @@ from __future__ import print_function, with_statement
 import os
 
 from collections import OrderedDict, namedtuple
+from functools import partial
 
 # TODO: use core.component.pci.I2cComponent
 from ..core.component import Priority, PciComponent
@@ -10,6 +11,7 @@ from ..core.component.i2c import I2cComponent
 from ..core.config import Config
 from ..core.driver.kernel import KernelDriver
 from ..core.fan import FanSlot
+from ..core.psu import PsuSlot
 from ..core.types import I2cAddr, MdioClause, MdioSpeed
 from ..core.utils import (
    FileWaiter,
@@ -556,6 +558,23 @@ class Scd(PciComponent):
          fans=[self.addFan(desc) for desc in fanDescs]
       )
 
+   def addPsuSlot(self, psuId, bus, psus, statusInventory=None, **kwargs):
+      '''Add a psu slot behind an smbus master of the scd, the status gpios are
+         looked up in statusInventory when they are not provided by the scd'''
+      name = 'psu%d' % psuId
+      statusInventory = statusInventory or self.inventory
+      return self.newComponent(
+         PsuSlot,
+         slotId=psuId,
+         addrFunc=partial(self.i2cAddr, bus, t=3, datr=2, datw=3),
+         presentGpio=self.inventory.getGpio('%s_present' % name),
+         inputOkGpio=statusInventory.getGpio('%s_ac_status' % name),
+         outputOkGpio=statusInventory.getGpio('%s_status' % name),
+         led=self.inventory.getLed(name),
+         psus=psus,
+         **kwargs
+      )
+
    def addMdioMaster(self, addr, masterId, busCount=1, speed=MdioSpeed.S2_5):
       self.mdioMasters[addr] = {
          'id': masterId,
@@ -18,6 +18,8 @@ class Card(Sku):
 
    def __init__(self, slot=None, standbyOnly=False, noStandby=False, **kwargs):
       self.slot = slot
+      # NOTE: incremented whenever the pci address of an asic changes
+      self.asicAddrEpoch = 0
       self.standby = None
       self.main = None
       self.cpu = None
@@ -57,7 +57,8 @@ class Component(LegacyComponent):
       return self.inventory.addFan(self.driver.getFan(desc, **kwargs))
 
    def addFans(self, descs, **kwargs):
-      return [self.addFan(desc, **kwargs) for desc in descs]
+      return self.inventory.addFans([self.driver.getFan(desc, **kwargs)
+                                     for desc in descs])
 
    def addFanLed(self, desc, **kwargs):
       return self.inventory.addLed(self.driver.getFanLed(desc, **kwargs))
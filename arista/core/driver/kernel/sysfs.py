@@ -1,17 +1,20 @@
 from __future__ import division, print_function, with_statement
 
-from collections import defaultdict
+from collections import OrderedDict
+from functools import lru_cache, partial
 import os
-import re
+import threading
+from weakref import WeakValueDictionary
 
 from ... import utils
 from ...config import Config
-from ...driver import Driver
 from ...log import getLogger
 
+from ....libs.python import cachedProperty, monotonicRaw
+
 from ....descs.fan import FanDesc
 from ....descs.led import LedColor
-from ....descs.rail import CurrentDesc, PowerDesc, RailDesc, VoltageDesc
+from ....descs.rail import CurrentDesc, PowerDesc, VoltageDesc
 from ....descs.sensor import SensorDesc
 
 from ....inventory.fan import Fan
@@ -23,128 +26,371 @@ from ....inventory.temp import Temp
 
 logging = getLogger(__name__)
 
+SYSFS_READ_SIZE = 4096
+
+class SysfsFdCache(object):
+   '''Keep read-only file descriptors on sysfs attributes open
+
+   Sysfs attributes are regenerated by the kernel on every read at offset 0,
+   keeping the descriptor around avoids an open/close pair per access.
+   The number of descriptors is bounded, the least recently used one is
+   closed when the capacity is reached.
+   '''
+
+   CAPACITY = 256
+
+   def __init__(self, capacity=None):
+      self.capacity = capacity or self.CAPACITY
+      self.fds = OrderedDict()
+      self.lock = threading.Lock()
+
+   def _release(self, path, fd):
+      closing = []
+      with self.lock:
+         if path in self.fds:
+            # NOTE: another thread already put a descriptor back for this path
+            closing.append(fd)
+         else:
+            self.fds[path] = fd
+            while len(self.fds) > self.capacity:
+               closing.append(self.fds.popitem(last=False)[1])
+      for oldFd in closing:
+         os.close(oldFd)
+
+   def read(self, path, size=SYSFS_READ_SIZE):
+      # NOTE: the descriptor is taken out of the cache while in use so that it
+      #       can't be closed and reused by another thread, the lock is only
+      #       held for the bookkeeping and not during slow i2c backed reads
+      with self.lock:
+         fd = self.fds.pop(path, None)
+      if fd is None:
+         fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+      try:
+         value = os.pread(fd, size, 0)
+      except OSError:
+         os.close(fd)
+         raise
+      self._release(path, fd)
+      return value
+
+   def evict(self, path):
+      with self.lock:
+         fd = self.fds.pop(path, None)
+      if fd is not None:
+         os.close(fd)
+
+   def clear(self):
+      with self.lock:
+         while self.fds:
+            _, fd = self.fds.popitem()
+            os.close(fd)
+
+# NOTE: the hwmon attributes re-read by the batch readers share a cache of
+#       their own so that they don't evict the other entries (gpios, leds,
+#       resets, ...), the process keeps at most 2 * CAPACITY descriptors open
+fdCache = SysfsFdCache()
+hwmonFdCache = SysfsFdCache()
+
+class HwmonBatchReader(object):
+   '''Share the reads of the hwmon attributes of a device during a poll cycle
+
+   Only the attributes that have been requested through SysfsEntry.read are
+   refreshed, and only the ones that change over time. Labels and thresholds
+   are static and keep being read directly.
+   The values are kept for a short period of time so that the consecutive
+   accesses to an attribute during a poll cycle share a single read.
+   '''
+
+   TTL = 0.5
+   SUFFIXES = ('_input', '_fault', '_alarm')
+
+   def __init__(self, path, ttl=None):
+      self.path = path
+      self.ttl = ttl if ttl is not None else self.TTL
+      self.names = set()
+      self.values = {}
+      self.timestamp = None
+
+   def __str__(self):
+      return '%s(path=%s)' % (self.__class__.__name__, self.path)
+
+   def _read(self, name):
+      try:
+         return hwmonFdCache.read(os.path.join(self.path, name))
+      except OSError:
+         return None
+
+   def refresh(self):
+      values = {}
+      for name in list(self.names):
+         value = self._read(name)
+         if value is not None:
+            values[name] = value
+      self.values = values
+      self.timestamp = monotonicRaw()
+
+   def invalidate(self):
+      self.timestamp = None
+
+   def get(self, name):
+      if not name.endswith(self.SUFFIXES):
+         return None
+      if name not in self.names:
+         # NOTE: a newly requested attribute is read on its own and joins the
+         #       next refresh
+         self.names.add(name)
+         value = self.values[name] = self._read(name)
+         return value
+      if self.timestamp is None or monotonicRaw() - self.timestamp > self.ttl:
+         self.refresh()
+      return self.values.get(name)
+
+# NOTE: how long in seconds a sysfs directory listing is reused, attributes
+#       come and go with hotplug (psus, linecards) and driver probes
+SYSFS_LISTING_TTL = 1.
+
+sysfsListings = {}
+
+def listSysfsDir(path, ttl=SYSFS_LISTING_TTL):
+   now = monotonicRaw()
+   cached = sysfsListings.get(path)
+   if cached is not None and now - cached[0] <= ttl:
+      return cached[1]
+   try:
+      names = frozenset(os.listdir(path))
+   except OSError:
+      sysfsListings.pop(path, None)
+      raise
+   sysfsListings[path] = (now, names)
+   return names
+
+hwmonBatchReaders = {}
+
+def getHwmonBatchReader(path):
+   reader = hwmonBatchReaders.get(path)
+   if reader is None:
+      reader = hwmonBatchReaders[path] = HwmonBatchReader(path)
+   return reader
+
+def callableKey(func):
+   if isinstance(func, partial):
+      return (func.func, func.args, tuple(sorted(func.keywords.items())))
+   return func
+
+sysfsEntries = WeakValueDictionary()
+
 class SysfsEntry(object):
-   def __init__(self, parent, name, pathCallback=None):
-      self.parent = parent
+   '''Accessor for a sysfs attribute
+
+   Entries are shared between all the users of the same attribute with the
+   same conversions so that their resolved path and batch reader are only
+   computed once.
+   '''
+
+   def __new__(cls, parent, name, readConversion=None, writeConversion=str,
+               pathCallback=None):
+      key = (cls, name, pathCallback is None,
+             callableKey(pathCallback or parent.driver.getHwmonEntry),
+             callableKey(readConversion or strReadConversion),
+             callableKey(writeConversion))
+      try:
+         entry = sysfsEntries.get(key)
+      except TypeError:
+         # NOTE: conversions bound to unhashable arguments are not shared
+         return super(SysfsEntry, cls).__new__(cls)
+      if entry is None:
+         entry = sysfsEntries[key] = super(SysfsEntry, cls).__new__(cls)
+      return entry
+
+   def __init__(self, parent, name, readConversion=None, writeConversion=str,
+                pathCallback=None):
+      if 'name' in self.__dict__:
+         return
       self.driver = parent.driver
       self.name = name
+      self.readConversion = readConversion or strReadConversion
+      self.writeConversion = writeConversion
+      self.hwmon = pathCallback is None
       self.pathCallback = pathCallback or self.driver.getHwmonEntry
-      self.entryPath_ = None
 
    def __str__(self):
       return '%s(path=%s)' % (self.__class__.__name__, self.entryPath)
 
-   @property
+   @cachedProperty
    def entryPath(self):
-      if self.entryPath_ is None:
-         self.entryPath_ = self.pathCallback(self.name)
-      return self.entryPath_
+      return self.pathCallback(self.name)
 
-   def exists(self):
-      return os.path.exists(self.entryPath)
+   @cachedProperty
+   def entryDir(self):
+      return os.path.dirname(self.entryPath)
 
-   def _readConversion(self, value):
-      return str(value)
+   @cachedProperty
+   def entryName(self):
+      return os.path.basename(self.entryPath)
 
-   def _writeConversion(self, value):
-      return str(value)
+   @cachedProperty
+   def batchReader(self):
+      if not self.hwmon:
+         return None
+      return getHwmonBatchReader(self.entryDir)
 
-   def _read(self):
-      if utils.inSimulation():
-         return '1'
+   def exists(self):
       try:
-         with open(self.entryPath, 'r') as f:
-            return f.read()
-      except IOError:
+         return self.entryName in listSysfsDir(self.entryDir)
+      except OSError:
+         return False
+
+   def _readSimulation(self):
+      return b'1'
+
+   def _readHardware(self):
+      if self.batchReader is not None:
+         value = self.batchReader.get(self.name)
+         if value is not None:
+            return value
+      try:
+         return fdCache.read(self.entryPath)
+      except OSError:
          logging.error("read sysfs failed on %s", self.entryPath)
          return None
 
-   def _write(self, value):
-      if utils.inSimulation():
-         return True
+   def _writeSimulation(self, value):
+      return True
+
+   def _writeHardware(self, value):
+      if self.batchReader is not None:
+         self.batchReader.invalidate()
       try:
-         with open(self.entryPath, 'w') as f:
-            f.write(value)
+         fd = os.open(self.entryPath, os.O_WRONLY | os.O_CLOEXEC)
+         try:
+            os.write(fd, value.encode())
+         finally:
+            os.close(fd)
       except Exception: # pylint: disable=broad-except
          return False
       return True
 
-   def read(self):
-      raw = self._read()
-      raw = raw.rstrip() if raw else raw
-      value = self._readConversion(raw)
+   # NOTE: selected by setupSysfsSimulation
+   _read = _readHardware
+   _write = _writeHardware
+
+   def _convert(self, raw):
+      # NOTE: the raw value is handed as bytes to the conversion, int() and
+      #       float() accept them directly and ignore surrounding whitespaces
+      value = self.readConversion(raw)
       logging.io('%s.read(): %s -> %s', self, raw, value)
       return value
 
+   def read(self):
+      return self._convert(self._read())
+
+   def readOr(self, default):
+      # NOTE: unlike read(), a failed access doesn't reach the conversion
+      raw = self._read()
+      return default if raw is None else self._convert(raw)
+
    def write(self, value):
-      raw = self._writeConversion(value)
+      raw = self.writeConversion(value)
       logging.io('%s.write(%s) -> %s', self, value, raw)
       return self._write(raw)
 
-class SysfsEntryInt(SysfsEntry):
-   def _readConversion(self, value):
-      return int(value)
-
-class SysfsEntryIntLinear(SysfsEntry):
-   def __init__(self, parent, name, fromRange=None, toRange=None, **kwargs):
-      super(SysfsEntryIntLinear, self).__init__(parent, name, **kwargs)
-      self.fromRange = fromRange
-      self.toRange = toRange
-
-   def _linearConversion(self, value, fromRange, toRange):
-      value -= fromRange[0]
-      value *= toRange[1] - toRange[0]
-      value //= fromRange[1]
-      return value + toRange[0]
-
-   def _readConversion(self, value):
-      return self._linearConversion(int(value), self.fromRange, self.toRange)
-
-   def _writeConversion(self, value):
-      return str(self._linearConversion(int(value), self.toRange, self.fromRange))
-
-class SysfsEntryFloat(SysfsEntry):
-   def __init__(self, parent, name, scale=1000., **kwargs):
-      super(SysfsEntryFloat, self).__init__(parent, name, **kwargs)
-      self.scale = scale
-
-   def _readConversion(self, value):
-      return float(value) / self.scale
-
-   def _writeConversion(self, value):
-      return str(int(value * self.scale))
-
-class SysfsEntryBool(SysfsEntry):
-   def _readConversion(self, value):
-      return bool(int(value))
-
-   def _writeConversion(self, value):
-      return str(int(value))
-
-class SysfsEntryIntLed(SysfsEntryInt):
-   def __init__(self, parent, name, **kwargs):
-      def getLedPath(n):
-         ledsPath = os.path.join(parent.driver.getSysfsPath(), 'leds')
-         return os.path.join(ledsPath, n, 'brightness')
-      super(SysfsEntryIntLed, self).__init__(parent, name, pathCallback=getLedPath,
-                                             **kwargs)
-
-class SysfsEntryCustomLed(SysfsEntryIntLed):
-   def __init__(self, parent, name, value2color=None):
-      self.value2color = value2color or {
-         0 : LedColor.OFF,
-         1 : LedColor.GREEN,
-         2 : LedColor.RED,
-         3 : LedColor.AMBER,
-      }
-      self.color2value = { v : k for k, v in self.value2color.items() }
-      super(SysfsEntryCustomLed, self).__init__(parent, name)
-
-   def _readConversion(self, value):
-      return self.value2color[int(value)]
-
-   def _writeConversion(self, value):
-      return str(self.color2value[value])
+def strReadConversion(value):
+   if isinstance(value, bytes):
+      value = value.decode()
+   return str(value).rstrip()
+
+def linearConversion(fromRange, toRange, value):
+   value = int(value)
+   value -= fromRange[0]
+   value *= toRange[1] - toRange[0]
+   value //= fromRange[1]
+   return value + toRange[0]
+
+def linearWriteConversion(fromRange, toRange, value):
+   return str(linearConversion(fromRange, toRange, value))
+
+def floatReadConversion(scale, value):
+   return float(value) / scale
+
+def floatWriteConversion(scale, value):
+   return str(int(value * scale))
+
+def boolReadConversion(value):
+   return bool(int(value))
+
+def boolWriteConversion(value):
+   return str(int(value))
+
+def ledColorReadConversion(value2color, value):
+   return value2color[int(value)]
+
+def ledColorWriteConversion(value2color, value):
+   return str(value2color.color2value[value])
+
+def getLedPath(driver, name):
+   ledsPath = os.path.join(driver.getSysfsPath(), 'leds')
+   return os.path.join(ledsPath, name, 'brightness')
+
+class LedColorTable(tuple):
+   '''Led colors indexed by the brightness value
+
+   The reverse mapping used on writes is resolved once per table, the table
+   still hashes as a tuple so that led entries can be shared.
+   '''
+
+   def __new__(cls, colors):
+      table = super(LedColorTable, cls).__new__(cls, colors)
+      table.color2value = {color: value for value, color in enumerate(table)
+                           if color is not None}
+      return table
+
+LED_VALUE2COLOR = LedColorTable((
+   LedColor.OFF,
+   LedColor.GREEN,
+   LedColor.RED,
+   LedColor.AMBER,
+))
+
+def SysfsEntryInt(parent, name, **kwargs):
+   return SysfsEntry(parent, name, readConversion=int, **kwargs)
+
+def SysfsEntryIntLinear(parent, name, fromRange=None, toRange=None, **kwargs):
+   return SysfsEntry(
+      parent, name,
+      readConversion=partial(linearConversion, fromRange, toRange),
+      writeConversion=partial(linearWriteConversion, toRange, fromRange),
+      **kwargs
+   )
+
+def SysfsEntryFloat(parent, name, scale=1000., **kwargs):
+   return SysfsEntry(
+      parent, name,
+      readConversion=partial(floatReadConversion, scale),
+      writeConversion=partial(floatWriteConversion, scale),
+      **kwargs
+   )
+
+def SysfsEntryBool(parent, name, **kwargs):
+   return SysfsEntry(parent, name, readConversion=boolReadConversion,
+                     writeConversion=boolWriteConversion, **kwargs)
+
+def SysfsEntryIntLed(parent, name, **kwargs):
+   return SysfsEntryInt(parent, name,
+                        pathCallback=partial(getLedPath, parent.driver),
+                        **kwargs)
+
+def SysfsEntryCustomLed(parent, name, value2color=None):
+   if value2color:
+      value2color = LedColorTable(value2color.get(value)
+                                  for value in range(max(value2color) + 1))
+   else:
+      value2color = LED_VALUE2COLOR
+   return SysfsEntry(
+      parent, name,
+      readConversion=partial(ledColorReadConversion, value2color),
+      writeConversion=partial(ledColorWriteConversion, value2color),
+      pathCallback=partial(getLedPath, parent.driver),
+   )
 
 class GenericSysfs(object):
 
@@ -175,18 +421,38 @@ class GenericSysfsImpl(GenericSysfs):
 
    SCALE_FACTOR = 1000.
 
-   def __init__(self, driver, desc, prefix=None, **kwargs):
+   def __init__(self, driver, desc, prefix=None):
       self.prefix = prefix or '%s%s' % (self.SYSFS_PREFIX, desc.__getoid__())
       self.driver = driver
       self.desc = desc
-      scale = self.SCALE_FACTOR
-      self.label = SysfsEntry(self, '%s_label' % self.prefix)
-      self.input = SysfsEntryFloat(self, '%s_input' % self.prefix, scale=scale)
-      self.max = SysfsEntryFloat(self, '%s_max' % self.prefix, scale=scale)
-      self.min = SysfsEntryFloat(self, '%s_min' % self.prefix, scale=scale)
-      self.crit = SysfsEntryFloat(self, '%s_crit' % self.prefix, scale=scale)
-      self.lcrit = SysfsEntryFloat(self, '%s_lcrit' % self.prefix, scale=scale)
-      self.__dict__.update(**kwargs)
+
+   def _floatEntry(self, suffix):
+      return SysfsEntryFloat(self, '%s_%s' % (self.prefix, suffix),
+                             scale=self.SCALE_FACTOR)
+
+   @cachedProperty
+   def label(self):
+      return SysfsEntry(self, '%s_label' % self.prefix)
+
+   @cachedProperty
+   def input(self):
+      return self._floatEntry('input')
+
+   @cachedProperty
+   def max(self):
+      return self._floatEntry('max')
+
+   @cachedProperty
+   def min(self):
+      return self._floatEntry('min')
+
+   @cachedProperty
+   def crit(self):
+      return self._floatEntry('crit')
+
+   @cachedProperty
+   def lcrit(self):
+      return self._floatEntry('lcrit')
 
    def _getOr(self, entry, *defaults):
       if entry.exists():
@@ -226,22 +492,34 @@ class FanSysfsImpl(Fan, GenericSysfs):
    MIN_FAN_SPEED = 30
    MAX_FAN_SPEED = 100
 
-   def __init__(self, driver, desc, maxPwm=255, led=None, faultGpio=None, **kwargs):
+   def __init__(self, driver, desc, maxPwm=255, led=None, faultGpio=None):
       self.driver = driver
       self.desc = desc
       self.fanId = desc.fanId
       self.maxPwm = maxPwm
       self.led = led
       self.lastSpeed = None
-      self.pwm = SysfsEntryIntLinear(self, 'pwm%d' % self.fanId,
-                                     fromRange=(0, maxPwm), toRange=(0, 100))
-      self.input = SysfsEntryInt(self, 'fan%d_input' % self.fanId)
-      self.airflow = SysfsEntry(self, 'fan%d_airflow' % self.fanId)
-      self.fault = SysfsEntryBool(self, 'fan%d_fault' % self.fanId)
-      self.present = SysfsEntryBool(self, 'fan%d_present' % self.fanId)
-      self.model = SysfsEntry(self, 'fan%d_model' % self.fanId)
+      pwm, inp, airflow, fault, present, model = self.entryNames(self.fanId)
+      self.pwm = SysfsEntryIntLinear(self, pwm, fromRange=(0, maxPwm),
+                                     toRange=(0, 100))
+      self.input = SysfsEntryInt(self, inp)
+      self.airflow = SysfsEntry(self, airflow)
+      self.fault = SysfsEntryBool(self, fault)
+      self.present = SysfsEntryBool(self, present)
+      self.model = SysfsEntry(self, model)
       self.faultGpio = faultGpio
-      self.__dict__.update(kwargs)
+
+   @staticmethod
+   @lru_cache(maxsize=256)
+   def entryNames(fanId):
+      return (
+         'pwm%d' % fanId,
+         'fan%d_input' % fanId,
+         'fan%d_airflow' % fanId,
+         'fan%d_fault' % fanId,
+         'fan%d_present' % fanId,
+         'fan%d_model' % fanId,
+      )
 
    def getId(self):
       return self.fanId
@@ -277,13 +555,24 @@ class FanSysfsImpl(Fan, GenericSysfs):
          return False
       return not self.getFault()
 
+   def _pwmHolds(self, speed):
+      # NOTE: compared on the raw value, a failed read is never a match
+      raw = self.pwm._read()
+      return raw is not None and int(raw) == int(self.pwm.writeConversion(speed))
+
    def setSpeed(self, speed):
+      # NOTE: the pwm can be reset behind our back (driver reload, failsafe),
+      #       the write is only skipped when the hardware still holds it
+      if speed == self.lastSpeed and self._pwmHolds(speed):
+         return True
       if self.lastSpeed == self.MAX_FAN_SPEED and speed != self.MAX_FAN_SPEED:
          logging.debug("%s fan speed reduced from max", self.getName())
       elif self.lastSpeed != self.MAX_FAN_SPEED and speed == self.MAX_FAN_SPEED:
          logging.warning("%s fan speed set to max", self.getName())
+      if not self.pwm.write(speed):
+         return False
       self.lastSpeed = speed
-      return self.pwm.write(speed)
+      return True
 
    def getRpm(self):
       if self.input.exists():
@@ -307,11 +596,10 @@ class FanSysfsImpl(Fan, GenericSysfs):
       return self.led
 
 class LedSysfsImpl(Led):
-   def __init__(self, driver, desc, **kwargs):
+   def __init__(self, driver, desc):
       self.driver = driver
       self.desc = desc
       self.brightness = SysfsEntryCustomLed(self, desc.name)
-      self.__dict__.update(kwargs)
 
    def getName(self):
       return self.desc.name
@@ -326,31 +614,45 @@ class LedSysfsImpl(Led):
       return 'sfp' in self.desc.name
 
 class LedRgbSysfsImpl(Led):
-   def __init__(self, driver, desc, prefix, **kwargs):
+
+   COLOR2VALUES = {
+      LedColor.OFF: (0, 0, 0),
+      LedColor.RED: (1, 0, 0),
+      LedColor.GREEN: (0, 1, 0),
+      LedColor.BLUE: (0, 0, 1),
+      LedColor.AMBER: (1, 1, 0),
+   }
+   # indexed by the red, green and blue states packed as bits 0, 1 and 2
+   VALUES2COLOR = (
+      LedColor.OFF,
+      LedColor.RED,
+      LedColor.GREEN,
+      LedColor.AMBER,
+      LedColor.BLUE,
+      None,
+      None,
+      None,
+   )
+
+   def __init__(self, driver, desc, prefix):
       self.driver = driver
       self.desc = desc
       self.red = SysfsEntryIntLed(self, '%s:red:%s' % (prefix, desc.name))
       self.green = SysfsEntryIntLed(self, '%s:green:%s' % (prefix, desc.name))
       self.blue = SysfsEntryIntLed(self, '%s:blue:%s' % (prefix, desc.name))
       self.leds = [self.red, self.green, self.blue]
-      self.color2values = {
-         LedColor.OFF: (0, 0, 0),
-         LedColor.RED: (1, 0, 0),
-         LedColor.GREEN: (0, 1, 0),
-         LedColor.BLUE: (0, 0, 1),
-         LedColor.AMBER: (1, 1, 0),
-      }
-      self.values2color = {v : c for c, v in self.color2values.items()}
 
    def getName(self):
       return self.desc.name
 
    def getColor(self):
-      values = tuple(led.read() if led.exists() else 0 for led in self.leds)
-      return self.values2color.get(values)
+      red = self.red.read() if self.red.exists() else 0
+      green = self.green.read() if self.green.exists() else 0
+      blue = self.blue.read() if self.blue.exists() else 0
+      return self.VALUES2COLOR[bool(red) | bool(green) << 1 | bool(blue) << 2]
 
    def setColor(self, color):
-      values = self.color2values.get(color, (0, 0, 0))
+      values = self.COLOR2VALUES.get(color, (0, 0, 0))
       for led, value in zip(self.leds, values):
          if led.exists():
             led.write(value)
@@ -365,19 +667,42 @@ class TempSysfsImpl(Temp, GenericSysfs):
    DESC_NAME = 'sensors'
    SYSFS_PREFIX = 'temp'
 
-   def __init__(self, driver, desc, **kwargs):
+   def __init__(self, driver, desc):
       self.tempId = desc.diode + 1
       self.driver = driver
       self.desc = desc
       self.reportHwThresh = Config().report_hw_thresholds
-      self.__dict__.update(**kwargs)
-      self.label = SysfsEntry(self, 'temp%d_label' % self.tempId)
-      self.input = SysfsEntryFloat(self, 'temp%d_input' % self.tempId)
-      self.max = SysfsEntryFloat(self, 'temp%d_max' % self.tempId)
-      self.crit = SysfsEntryFloat(self, 'temp%d_crit' % self.tempId)
-      self.min = SysfsEntryFloat(self, 'temp%d_min' % self.tempId)
-      self.lcrit = SysfsEntryFloat(self, 'temp%d_lcrit' % self.tempId)
-      self.fault = SysfsEntryBool(self, 'temp%d_fault' % self.tempId)
+
+   # NOTE: the entries are only created when first used, most sensors only
+   #       ever get their input read
+
+   @cachedProperty
+   def label(self):
+      return SysfsEntry(self, 'temp%d_label' % self.tempId)
+
+   @cachedProperty
+   def input(self):
+      return SysfsEntryFloat(self, 'temp%d_input' % self.tempId)
+
+   @cachedProperty
+   def max(self):
+      return SysfsEntryFloat(self, 'temp%d_max' % self.tempId)
+
+   @cachedProperty
+   def crit(self):
+      return SysfsEntryFloat(self, 'temp%d_crit' % self.tempId)
+
+   @cachedProperty
+   def min(self):
+      return SysfsEntryFloat(self, 'temp%d_min' % self.tempId)
+
+   @cachedProperty
+   def lcrit(self):
+      return SysfsEntryFloat(self, 'temp%d_lcrit' % self.tempId)
+
+   @cachedProperty
+   def fault(self):
+      return SysfsEntryBool(self, 'temp%d_fault' % self.tempId)
 
    def getName(self):
       if self.desc.name:
@@ -451,22 +776,27 @@ class TempSysfsImpl(Temp, GenericSysfs):
       return False
 
    def refreshHardwareThresholds(self):
-      self.setLowThreshold(self.desc.low)
-      self.setLowCriticalThreshold(self.desc.lcritical)
-      self.setHighThreshold(self.desc.overheat)
-      self.setHighCriticalThreshold(self.desc.critical)
+      thresholds = (
+         (self.min, self.desc.low),
+         (self.lcrit, self.desc.lcritical),
+         (self.max, self.desc.overheat),
+         (self.crit, self.desc.critical),
+      )
+      for entry, value in thresholds:
+         if entry.exists():
+            entry.write(value)
 
 class ResetSysfsImpl(Reset):
-   def __init__(self, driver, desc, **kwargs):
+   def __init__(self, driver, desc):
       self.driver = driver
       self.desc = desc
       self.addr = desc.addr
       self.bit = desc.bit
       self.name = desc.name
-      def getResetPath(name):
-         return os.path.join(driver.getSysfsPath(), name)
-      self.reset = SysfsEntryBool(self, desc.name, pathCallback=getResetPath)
-      self.__dict__.update(**kwargs)
+      self.reset = SysfsEntryBool(self, desc.name, pathCallback=self.getResetPath)
+
+   def getResetPath(self, name):
+      return os.path.join(self.driver.getSysfsPath(), name)
 
    def getName(self):
       return self.name
@@ -481,7 +811,7 @@ class ResetSysfsImpl(Reset):
       return self.reset.write(False)
 
 class GpioSysfsImpl(Gpio):
-   def __init__(self, driver, desc, hwActiveLow=False, **kwargs):
+   def __init__(self, driver, desc, hwActiveLow=False):
       self.driver = driver
       self.desc = desc
       self.addr = desc.addr
@@ -490,10 +820,10 @@ class GpioSysfsImpl(Gpio):
       self.ro = desc.ro
       self.activeLow = desc.activeLow
       self.hwActiveLow = hwActiveLow
-      def getGpioPath(name):
-         return os.path.join(self.driver.getSysfsPath(), name)
-      self.gpio = SysfsEntryBool(self, self.name, pathCallback=getGpioPath)
-      self.__dict__.update(**kwargs)
+      self.gpio = SysfsEntryBool(self, self.name, pathCallback=self.getGpioPath)
+
+   def getGpioPath(self, name):
+      return os.path.join(self.driver.getSysfsPath(), name)
 
    def getName(self):
       return self.name
@@ -519,13 +849,21 @@ class GpioSysfsImpl(Gpio):
    def setRawValue(self, value):
       self.gpio.write(value)
 
-   def _activeValue(self):
+   @cachedProperty
+   def activeValue(self):
+      # NOTE: the sysfs gpio drivers don't sysfs_notify() value changes so the
+      #       attribute still has to be read on every call, only the expected
+      #       value is fixed for the lifetime of the object
       return 0 if self.isActiveLow() else 1
 
-   def isActive(self):
-      if utils.inSimulation():
-         return True
-      return self.getRawValue() == self._activeValue()
+   def isActiveSimulation(self):
+      return True
+
+   def isActiveHardware(self):
+      return self.getRawValue() == self.activeValue
+
+   # NOTE: selected by setupSysfsSimulation
+   isActive = isActiveHardware
 
    def setActive(self, value):
       self.setRawValue(not value if self.isActiveLow() else value)
@@ -558,52 +896,92 @@ class PowerSysfsImpl(GenericSysfsImpl):
    def getPower(self):
       return self.getInput()
 
-class RailSysfsRawImpl(Rail):
-   def __init__(self, driver, desc, **kwargs):
-      self.railId = desc.railId
-      self.driver = driver
-      self.desc = desc
-      self.__dict__.update(**kwargs)
-      self.voltage = SysfsEntryFloat(self, 'in%d_input' % self.railId)
-      self.current = SysfsEntryFloat(self, 'curr%d_input' % self.railId)
-      self.power = SysfsEntryFloat(self, 'power%d_input' % self.railId,
-                                   scale=1000000.)
+def divideEntries(dividend, divisor):
+   dividend, divisor = dividend.readOr(None), divisor.readOr(None)
+   if dividend is None or divisor is None:
+      return None
+   return dividend / divisor if divisor != 0 else 0
 
-   def _tryComputeDiv(self, dividend, divisor):
-      if not dividend.exists() or not divisor.exists():
-         return 0
-      divisor = divisor.read()
-      return dividend.read() / divisor if divisor != 0 else 0
+def multiplyEntries(val1, val2):
+   val1, val2 = val1.readOr(None), val2.readOr(None)
+   if val1 is None or val2 is None:
+      return None
+   return val1 * val2
+
+def returnZero():
+   return 0
+
+def readRailGetter(rail, name, getter):
+   value = getter()
+   if value is None:
+      # NOTE: the attributes went away (e.g psu removed), the getter is
+      #       resolved again on the next call
+      rail.__dict__.pop(name, None)
+      return 0
+   return value
+
+class RailSysfsBase(Rail):
+   '''Rail values are either exposed by the device or computed from the two
+   other ones. Which one applies only depends on the attributes exposed by
+   the device, so it is resolved on first use and the getter is replaced by
+   the matching accessor on the instance, until the attributes go away.
+   '''
 
-   def _tryComputeMul(self, val1, val2):
-      if not val1.exists() or not val2.exists():
-         return 0
-      return val1.read() * val2.read()
+   def _railEntries(self):
+      raise NotImplementedError
+
+   def _resolveGetter(self, name, entry, compute, operand1, operand2):
+      try:
+         listSysfsDir(entry.entryDir)
+      except OSError:
+         # device not available yet, resolve on a later call
+         return returnZero
+      if entry.exists():
+         getter = partial(entry.readOr, None)
+      elif operand1.exists() and operand2.exists():
+         getter = partial(compute, operand1, operand2)
+      else:
+         getter = returnZero
+      getter = partial(readRailGetter, self, name, getter)
+      setattr(self, name, getter)
+      return getter
 
    def getName(self):
       return self.desc.name
 
    def getCurrent(self):
-      if self.current.exists():
-         return self.current.read()
-      return self._tryComputeDiv(self.power, self.voltage)
+      voltage, current, power = self._railEntries()
+      return self._resolveGetter('getCurrent', current, divideEntries,
+                                 power, voltage)()
 
    def getVoltage(self):
-      if self.voltage.exists():
-         return self.voltage.read()
-      return self._tryComputeDiv(self.power, self.current)
+      voltage, current, power = self._railEntries()
+      return self._resolveGetter('getVoltage', voltage, divideEntries,
+                                 power, current)()
 
    def getPower(self):
-      if self.power.exists():
-         return self.power.read()
-      return self._tryComputeMul(self.current, self.voltage)
+      voltage, current, power = self._railEntries()
+      return self._resolveGetter('getPower', power, multiplyEntries,
+                                 current, voltage)()
 
-class RailSysfsImpl(Rail):
-   def __init__(self, driver, desc, **kwargs):
+class RailSysfsRawImpl(RailSysfsBase):
+   def __init__(self, driver, desc):
+      self.railId = desc.railId
+      self.driver = driver
+      self.desc = desc
+      self.voltage = SysfsEntryFloat(self, 'in%d_input' % self.railId)
+      self.current = SysfsEntryFloat(self, 'curr%d_input' % self.railId)
+      self.power = SysfsEntryFloat(self, 'power%d_input' % self.railId,
+                                   scale=1000000.)
+
+   def _railEntries(self):
+      return self.voltage, self.current, self.power
+
+class RailSysfsImpl(RailSysfsBase):
+   def __init__(self, driver, desc):
       self.railId = desc.railId
       self.driver = driver
       self.desc = desc
-      self.__dict__.update(**kwargs)
       self.voltage = VoltageSysfsImpl(driver, self._getVoltageDesc(desc))
       self.current = CurrentSysfsImpl(driver, self._getCurrentDesc(desc))
       self.power = PowerSysfsImpl(driver, self._getPowerDesc(desc))
@@ -629,38 +1007,19 @@ class RailSysfsImpl(Rail):
          direction=desc.direction
       )
 
-   def _tryComputeDiv(self, dividend, divisor):
-      if not dividend or not divisor:
-         return 0
-      divisor = divisor.getInput()
-      return dividend.getInput() / divisor if divisor != 0 else 0
-
-   def _tryComputeMul(self, val1, val2):
-      if not val1 or not val2:
-         return 0
-      return val1.getInput() * val2.getInput()
-
-   def getName(self):
-      return self.desc.name
-
-   def getCurrent(self):
-      if self.current:
-         value = self.current.getCurrent()
-         if value is not None:
-             return value
-      return self._tryComputeDiv(self.power, self.voltage)
-
-   def getVoltage(self):
-      if self.voltage:
-         value = self.voltage.getVoltage()
-         if value is not None:
-             return value
-      return self._tryComputeDiv(self.power, self.current)
-
-   def getPower(self):
-      if self.power:
-         value = self.power.getPower()
-         if value is not None:
-             return value
-      return self._tryComputeMul(self.current, self.voltage)
-
+   def _railEntries(self):
+      return self.voltage.input, self.current.input, self.power.input
+
+def setupSysfsSimulation(simulation):
+   # NOTE: simulation is a process wide setting, pick the accessors once
+   #       instead of checking it on every sysfs access
+   if simulation:
+      SysfsEntry._read = SysfsEntry._readSimulation
+      SysfsEntry._write = SysfsEntry._writeSimulation
+      GpioSysfsImpl.isActive = GpioSysfsImpl.isActiveSimulation
+   else:
+      SysfsEntry._read = SysfsEntry._readHardware
+      SysfsEntry._write = SysfsEntry._writeHardware
+      GpioSysfsImpl.isActive = GpioSysfsImpl.isActiveHardware
+
+utils.registerSimulationHook(setupSysfsSimulation)
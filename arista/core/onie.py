@@ -1,5 +1,6 @@
 
 import datetime
+from functools import lru_cache
 
 from ..core.config import etcPath
 
@@ -8,6 +9,22 @@ from ..libs.procfs import getCmdlineDict
 from ..libs.onie import getMachineConfigDict
 
 class OnieEeprom(object):
+   # NOTE: order in which the fields are reported
+   LAYOUT = (
+      0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28,
+      0x2A, 0x2B, 0x2C, 0x2D, 0x2E, 0x2F, 0xFE,
+   )
+
+   # NOTE: fields that don't depend on the prefdl, shared by all the instances
+   COMMON_FIELDS = {
+      0x26: "01",
+      0x2A: 0xffff, # num macs (could be added using per platform metadata)
+      0x2B: 'Arista Networks', # manufacturer
+      0x2C: 'US', # manufacturer country code
+      0x2D: 'Arista Networks',
+      0xFE: 0xdeadbeef, # CRC
+   }
+
    def __init__(self, prefdl):
       self.fields = {
          0x21: prefdl.get('SKU'),
@@ -15,16 +32,10 @@ class OnieEeprom(object):
          0x23: prefdl.get('SerialNumber'),
          0x24: prefdl.get('MAC', ''),
          0x25: self._convertMfgTime(prefdl.get('MfgTime2', prefdl.get('MfgTime'))),
-         0x26: "01",
          0x27: self._convertHwApi(prefdl.get('HwApi')),
          0x28: self._getOniePlatform() or prefdl.get('SID'),
-         0x2A: 0xffff, # num macs (could be added using per platform metadata)
-         0x2B: 'Arista Networks', # manufacturer
-         0x2C: 'US', # manufacturer country code
-         0x2D: 'Arista Networks',
          0x2E: self._getAbootVersion(), # XXX: won't work for modules
          0x2F: prefdl.get('SerialNumber'), # service tag
-         0xFE: 0xdeadbeef, # CRC
       }
 
    def _convertHwApi(self, hwApi):
@@ -32,10 +43,14 @@ class OnieEeprom(object):
          return hwApi
       return '.'.join('%02x' % v for v in hwApi or [0, 0])
 
-   def _getAbootVersion(self):
+   @staticmethod
+   @lru_cache(maxsize=None)
+   def _getAbootVersion():
       return getCmdlineDict().get('Aboot', 'N/A')
 
-   def _getOniePlatform(self):
+   @staticmethod
+   @lru_cache(maxsize=None)
+   def _getOniePlatform():
       name = getCmdlineDict().get('onie_platform')
       if name is not None:
          return name
@@ -54,9 +69,9 @@ class OnieEeprom(object):
       return dobj.strftime('%Y/%m/%d %H:%M:%S')
 
    def getField(self, code):
-      return self.fields.get(code)
+      return self.fields.get(code, self.COMMON_FIELDS.get(code))
 
    def data(self, filterOut=None):
       filterOut = filterOut or []
-      return {'0x%02X' % k : v for k, v in self.fields.items()
-              if v and k not in filterOut}
+      fields = ((k, self.getField(k)) for k in self.LAYOUT)
+      return {'0x%02X' % k : v for k, v in fields if v and k not in filterOut}
@@ -173,6 +173,12 @@ def registerPlatform():
    def wrapper(cls):
       platforms.append(cls)
 
+      # NOTE: the identifiers are immutable once the platform is registered
+      assert isinstance(cls.SID, (list, tuple)), 'SID must be a list'
+      assert isinstance(cls.SKU, (list, tuple)), 'SKU must be a list'
+      cls.SID = tuple(cls.SID)
+      cls.SKU = tuple(cls.SKU)
+
       for sid in cls.SID:
          platformSidIndex[sid] = cls
       for sku in cls.SKU:
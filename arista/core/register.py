@@ -215,10 +215,19 @@ class RegisterMap(object):
       self.parent_ = parent
       self.attributes_ = []
       self.offset = offset
-      for key in dir(self):
-         attr = getattr(self, key)
-         if isinstance(attr, Register):
-            self._updateAttributes(copy.deepcopy(attr))
+      for reg in self._registers():
+         self._updateAttributes(copy.deepcopy(reg))
+
+   @classmethod
+   def _registers(cls):
+      # NOTE: the register definitions of a map are fixed, look them up once
+      #       per class instead of walking dir() for every instance
+      regs = cls.__dict__.get('registers_')
+      if regs is None:
+         regs = tuple(attr for attr in (getattr(cls, key) for key in dir(cls))
+                      if isinstance(attr, Register))
+         cls.registers_ = regs
+      return regs
 
    def _updateAttributes(self, reg):
       reg.addr += self.offset
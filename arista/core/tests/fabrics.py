@@ -1,7 +1,7 @@
 
 from __future__ import absolute_import, division, print_function
 
-from ...tests.testing import unittest
+from ...tests.testing import unittest, patch
 from ...tests.logging import getLogger
 
 from ...components.denali.card import DenaliFabricSlot
@@ -53,5 +53,22 @@ class FabricTest(unittest.TestCase):
          fabric.clean()
          assert fabric
 
+   def testUpdateAsicAddr(self):
+      for name, fabricCls in getPlatformSkus().items():
+         if not issubclass(fabricCls, DenaliFabric):
+            continue
+         self.logger.info('Testing asic address update for fabric %s', name)
+         fabric = self.createFabric(fabricCls)
+         path = 'arista.components.denali.card.readSecondaryBus'
+         with patch(path, return_value=0x10):
+            fabric.updateAsicAddr()
+            epoch = fabric.asicAddrEpoch
+            self.assertEqual(fabric.asics[0].addr, PciAddr(bus=0x10))
+            fabric.updateAsicAddr()
+            self.assertEqual(fabric.asicAddrEpoch, epoch)
+         with patch(path, return_value=0x20):
+            fabric.updateAsicAddr()
+            self.assertEqual(fabric.asicAddrEpoch, epoch + 1)
+
 if __name__ == '__main__':
    unittest.main()
@@ -34,8 +34,8 @@ class RegisterTest(unittest.TestCase):
 
       for cls in platform.getPlatforms():
          self.assertIsInstance(cls.PLATFORM, (type(None), str))
-         self.assertIsInstance(cls.SID, list)
-         self.assertIsInstance(cls.SKU, list)
+         self.assertIsInstance(cls.SID, tuple)
+         self.assertIsInstance(cls.SKU, tuple)
 
    def testPlatformInstance(self):
       platform.loadPlatforms()
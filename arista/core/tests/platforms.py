@@ -58,7 +58,7 @@ def mock_writeComponents(self, components, filename):
    assert filename
 
 def mock_sysfsRead(self):
-   return '1'
+   return b'1'
 
 def mock_sysfsWrite(self, value):
    assert value is not None
@@ -151,6 +151,15 @@ class CoreRegisterTest(unittest.TestCase):
       self.assertEqual(regs.bit0(), 0)
       self.assertEqual(regs2.bit0(), 1)
 
+   def testSubclassRegisters(self):
+      class ExtendedRegisterMap(FakeRegisterMap):
+         EXTRA = Register(0x09, name='extra')
+
+      regs = ExtendedRegisterMap(self.driver)
+      self.assertIn('extra', regs.attributes_)
+      self.assertIn('revision', regs.attributes_)
+      self.assertNotIn('extra', FakeRegisterMap(self.driver).attributes_)
+
    def testClearOnRead(self):
       driver = self.driver
       regs = self.regs
@@ -0,0 +1,160 @@
+from __future__ import absolute_import, division, print_function
+
+from ...tests.testing import unittest, mock, patch
+
+try:
+   from ...utils.sonic_platform import module
+except ImportError:
+   module = None
+
+class MockInventory(object):
+   def __init__(self, fans=None, temps=None):
+      self.fans = fans or []
+      self.temps = temps or []
+      self.loads = 0
+
+   def getFans(self):
+      self.loads += 1
+      return self.fans
+
+   def getTemps(self):
+      self.loads += 1
+      return self.temps
+
+class MockCard(object):
+   def __init__(self, slotId=3, relSlotId=1, eeprom=None, inventory=None):
+      self.slotId = slotId
+      self.relSlotId = relSlotId
+      self.eeprom = eeprom if eeprom is not None else {'SerialNumber': 'SN1'}
+      self.inventory = inventory or MockInventory()
+      self.present = True
+      self.powered = True
+      self.asics = []
+      self.asicAddrEpoch = 0
+      self.eepromReads = 0
+      self.presenceReads = 0
+
+   def getSlotId(self):
+      return self.slotId
+
+   def getRelativeSlotId(self):
+      return self.relSlotId
+
+   def getInventory(self):
+      return self.inventory
+
+   def getEeprom(self):
+      self.eepromReads += 1
+      return self.eeprom
+
+   def getPresence(self):
+      self.presenceReads += 1
+      return self.present
+
+   def poweredOn(self):
+      return self.powered
+
+   def updateAsicAddr(self):
+      pass
+
+@unittest.skipIf(module is None, 'sonic_platform_base is not available')
+class ModuleTest(unittest.TestCase):
+   def setUp(self):
+      self.now = 100.
+      patcher = patch.object(module, 'monotonicRaw', lambda: self.now)
+      patcher.start()
+      self.addCleanup(patcher.stop)
+
+   def expire(self):
+      self.now += max(module.Module.PRESENCE_CACHE_TTL,
+                      module.LinecardModule.PING_CACHE_TTL)
+
+   def testEepromRemoveReinsert(self):
+      card = MockCard()
+      mod = module.LinecardModule(card)
+      self.assertEqual(mod.get_serial(), 'SN1')
+      card.present = False
+      self.expire()
+      self.assertIsNone(mod.get_serial())
+      self.assertFalse(mod.get_presence())
+      card.present = True
+      card.eeprom = {'SerialNumber': 'SN2'}
+      self.expire()
+      self.assertEqual(mod.get_serial(), 'SN2')
+
+   def testEepromPresenceCached(self):
+      card = MockCard()
+      mod = module.LinecardModule(card)
+      reads = card.eepromReads
+      for _ in range(3):
+         self.assertEqual(mod.get_serial(), 'SN1')
+         self.assertTrue(mod.get_presence())
+      self.assertEqual(card.presenceReads, 1)
+      self.assertEqual(card.eepromReads, reads)
+
+   def testEepromRetriedWhileEmpty(self):
+      card = MockCard(eeprom={})
+      mod = module.LinecardModule(card)
+      self.assertIsNone(mod.get_serial())
+      card.eeprom = {'SerialNumber': 'SN1'}
+      self.assertEqual(mod.get_serial(), 'SN1')
+
+   @patch.object(module, 'OnieEeprom')
+   def testSystemEepromInfo(self, onieEeprom):
+      onieEeprom.return_value.data.return_value = {'0x23': 'SN1'}
+      mod = module.LinecardModule(MockCard())
+      info = mod.get_system_eeprom_info()
+      info['0x23'] = 'SN2'
+      self.assertEqual(mod.get_system_eeprom_info(), {'0x23': 'SN1'})
+      onieEeprom.return_value.data.assert_called_once_with(filterOut=(0x28,))
+
+   def testLazyFansAndThermals(self):
+      fans = [mock.MagicMock(), mock.MagicMock()]
+      temps = [mock.MagicMock(), mock.MagicMock()]
+      card = MockCard(inventory=MockInventory(fans=fans, temps=temps))
+      mod = module.LinecardModule(card)
+      self.assertEqual(card.inventory.loads, 0)
+      self.assertEqual(mod.get_num_fans(), 2)
+      self.assertIs(mod.get_fan(1)._fan, fans[1])
+      self.assertEqual(mod.get_num_thermals(), 2)
+      self.assertEqual([t._index for t in mod.get_all_thermals()], [1, 2])
+      mod.get_all_fans()
+      mod.get_all_thermals()
+      self.assertEqual(card.inventory.loads, 2)
+
+   def testNames(self):
+      card = MockCard(slotId=3, relSlotId=1)
+      self.assertEqual(module.SupervisorModule(card).get_name(), 'SUPERVISOR2')
+      self.assertEqual(module.FabricModule(card).get_name(), 'FABRIC-CARD1')
+      linecard = module.LinecardModule(card)
+      self.assertEqual(linecard.get_name(), 'LINE-CARD1')
+      self.assertEqual(linecard.get_midplane_ip(), '127.100.3.1')
+      self.assertEqual(linecard.get_slot(), 3)
+
+   @patch.object(module, 'ping', return_value=True)
+   def testMidplanePingCached(self, ping):
+      card = MockCard()
+      mod = module.LinecardModule(card)
+      self.assertTrue(mod.is_midplane_reachable())
+      self.assertTrue(mod.is_midplane_reachable())
+      ping.assert_called_once_with('127.100.3.1')
+      self.expire()
+      self.assertTrue(mod.is_midplane_reachable())
+      self.assertEqual(ping.call_count, 2)
+      card.powered = False
+      self.assertFalse(mod.is_midplane_reachable())
+      self.assertEqual(ping.call_count, 2)
+
+   def testAsicListEpoch(self):
+      card = MockCard(relSlotId=1)
+      card.asics = [mock.MagicMock(addr='0000:01:00.0')]
+      fabric = module.FabricModule(card)
+      asics = fabric.get_all_asics()
+      self.assertEqual(asics, [(1, '0000:01:00.0')])
+      self.assertIs(fabric.get_all_asics(), asics)
+      card.asics[0].addr = '0000:02:00.0'
+      card.asicAddrEpoch += 1
+      self.assertEqual(fabric.get_all_asics(), [(1, '0000:02:00.0')])
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,348 @@
+from __future__ import absolute_import, division, print_function
+
+import errno
+import os
+import shutil
+import tempfile
+
+from ...tests.testing import unittest, patch
+
+from ...descs.fan import FanDesc
+from ...descs.led import LedColor
+from ...descs.rail import RailDesc
+from ...descs.sensor import SensorDesc
+
+from ..driver.kernel.sysfs import (
+   FanSysfsImpl,
+   HwmonBatchReader,
+   RailSysfsImpl,
+   RailSysfsRawImpl,
+   SysfsEntry,
+   SysfsEntryBool,
+   SysfsEntryCustomLed,
+   SysfsEntryFloat,
+   SysfsEntryIntLinear,
+   SysfsFdCache,
+   TempSysfsImpl,
+   fdCache,
+   getHwmonBatchReader,
+   hwmonBatchReaders,
+   hwmonFdCache,
+   sysfsListings,
+)
+
+class MockHwmonDriver(object):
+   def __init__(self, path):
+      self.path = path
+
+   def getSysfsPath(self):
+      return self.path
+
+   def getHwmonPath(self):
+      return self.path
+
+   def getHwmonEntry(self, name):
+      return os.path.join(self.path, name)
+
+class MockSysfsImpl(object):
+   def __init__(self, driver):
+      self.driver = driver
+
+class SysfsTestBase(unittest.TestCase):
+   def setUp(self):
+      for attr in ('_read', '_write'):
+         hwAttr = '%sHardware' % attr
+         patcher = patch.object(SysfsEntry, attr, getattr(SysfsEntry, hwAttr))
+         patcher.start()
+         self.addCleanup(patcher.stop)
+      self.path = tempfile.mkdtemp()
+      self.impl = MockSysfsImpl(MockHwmonDriver(self.path))
+
+   def tearDown(self):
+      fdCache.clear()
+      sysfsListings.clear()
+      hwmonFdCache.clear()
+      hwmonBatchReaders.clear()
+      shutil.rmtree(self.path)
+
+   def _writeFile(self, name, value):
+      with open(os.path.join(self.path, name), 'w') as f:
+         f.write(value)
+
+class HwmonBatchReaderTest(SysfsTestBase):
+   def testBatchRead(self):
+      self._writeFile('temp1_input', '42000\n')
+      self._writeFile('temp2_input', '43000\n')
+      self._writeFile('temp1_max', '80000\n')
+      reader = HwmonBatchReader(self.path)
+      self.assertEqual(reader.get('temp1_input'), b'42000\n')
+      self.assertIsNone(reader.get('temp1_max'))
+      self.assertEqual(reader.names, {'temp1_input'})
+      reader.refresh()
+      self.assertEqual(reader.values, {'temp1_input': b'42000\n'})
+
+   def testCachedUntilInvalidated(self):
+      self._writeFile('temp1_input', '42000\n')
+      reader = HwmonBatchReader(self.path, ttl=3600)
+      self.assertEqual(reader.get('temp1_input'), b'42000\n')
+      reader.refresh()
+      self._writeFile('temp1_input', '43000\n')
+      self.assertEqual(reader.get('temp1_input'), b'42000\n')
+      reader.invalidate()
+      self.assertEqual(reader.get('temp1_input'), b'43000\n')
+
+   def testNewAttributeReadDirectly(self):
+      self._writeFile('temp1_input', '42000\n')
+      self._writeFile('temp2_input', '43000\n')
+      reader = HwmonBatchReader(self.path, ttl=3600)
+      self.assertEqual(reader.get('temp1_input'), b'42000\n')
+      reader.refresh()
+      self._writeFile('temp2_input', '44000\n')
+      self.assertEqual(reader.get('temp2_input'), b'44000\n')
+
+   def testSharedDescriptors(self):
+      self._writeFile('temp1_input', '42000\n')
+      os.makedirs(os.path.join(self.path, 'hwmon1'))
+      self._writeFile(os.path.join('hwmon1', 'temp1_input'), '43000\n')
+      HwmonBatchReader(self.path).get('temp1_input')
+      HwmonBatchReader(os.path.join(self.path, 'hwmon1')).get('temp1_input')
+      self.assertEqual(list(hwmonFdCache.fds), [
+         os.path.join(self.path, 'temp1_input'),
+         os.path.join(self.path, 'hwmon1', 'temp1_input'),
+      ])
+      self.assertFalse(fdCache.fds)
+
+   def testEntryRead(self):
+      self._writeFile('temp1_input', '42000\n')
+      self._writeFile('pwm1', '255\n')
+      temp = SysfsEntryFloat(self.impl, 'temp1_input')
+      pwm = SysfsEntryIntLinear(self.impl, 'pwm1', fromRange=(0, 255),
+                                toRange=(0, 100))
+      self.assertEqual(temp.read(), 42.)
+      self.assertEqual(pwm.read(), 100)
+
+   def testEntryWriteInvalidates(self):
+      self._writeFile('temp1_max', '80000\n')
+      entry = SysfsEntryFloat(self.impl, 'temp1_max')
+      self.assertEqual(entry.read(), 80.)
+      self.assertTrue(entry.write(70.))
+      self.assertEqual(entry.read(), 70.)
+
+class SysfsFdCacheTest(SysfsTestBase):
+   def testRereadOpenFile(self):
+      self._writeFile('temp1_input', '42000\n')
+      path = os.path.join(self.path, 'temp1_input')
+      cache = SysfsFdCache()
+      self.assertEqual(cache.read(path), b'42000\n')
+      self._writeFile('temp1_input', '43000\n')
+      self.assertEqual(cache.read(path), b'43000\n')
+      cache.clear()
+
+   def testEviction(self):
+      cache = SysfsFdCache(capacity=2)
+      paths = []
+      for i in range(3):
+         name = 'temp%d_input' % i
+         self._writeFile(name, '%d\n' % i)
+         paths.append(os.path.join(self.path, name))
+         self.assertEqual(cache.read(paths[-1]), b'%d\n' % i)
+      self.assertEqual(list(cache.fds), paths[1:])
+      cache.read(paths[1])
+      self.assertEqual(list(cache.fds), [paths[2], paths[1]])
+      cache.clear()
+      self.assertFalse(cache.fds)
+
+   def testUnlockedRead(self):
+      self._writeFile('temp1_input', '42000\n')
+      path = os.path.join(self.path, 'temp1_input')
+      cache = SysfsFdCache()
+      pread = os.pread
+      def checkedPread(fd, size, offset):
+         self.assertFalse(cache.lock.locked())
+         self.assertNotIn(path, cache.fds)
+         return pread(fd, size, offset)
+      with patch('os.pread', checkedPread):
+         self.assertEqual(cache.read(path), b'42000\n')
+      self.assertIn(path, cache.fds)
+      cache.clear()
+
+   def testMissingFile(self):
+      cache = SysfsFdCache()
+      with self.assertRaises(OSError):
+         cache.read(os.path.join(self.path, 'missing'))
+      self.assertFalse(cache.fds)
+
+class SysfsEntryTest(SysfsTestBase):
+   def testExists(self):
+      self._writeFile('temp1_input', '42000\n')
+      self.assertTrue(SysfsEntry(self.impl, 'temp1_input').exists())
+      self.assertFalse(SysfsEntry(self.impl, 'temp1_max').exists())
+
+   def testExistsMissingDirectory(self):
+      impl = MockSysfsImpl(MockHwmonDriver(os.path.join(self.path, 'unbound')))
+      self.assertFalse(SysfsEntry(impl, 'temp1_input').exists())
+
+   @patch('arista.core.driver.kernel.sysfs.monotonicRaw')
+   def testExistsHotplug(self, monotonicRaw):
+      monotonicRaw.return_value = 100.
+      entry = SysfsEntry(self.impl, 'temp1_input')
+      self.assertFalse(entry.exists())
+      self._writeFile('temp1_input', '42000\n')
+      self.assertFalse(entry.exists())
+      monotonicRaw.return_value = 102.
+      self.assertTrue(entry.exists())
+
+   def testConversions(self):
+      self._writeFile('fan1_fault', '1\n')
+      self._writeFile('pwm1', '128\n')
+      self._writeFile('temp1_input', '42500\n')
+      self.assertIs(SysfsEntryBool(self.impl, 'fan1_fault').read(), True)
+      self.assertEqual(SysfsEntryIntLinear(self.impl, 'pwm1', fromRange=(0, 255),
+                                           toRange=(0, 100)).read(), 50)
+      self.assertEqual(SysfsEntryFloat(self.impl, 'temp1_input').read(), 42.5)
+
+   def testString(self):
+      self._writeFile('temp1_label', 'Board sensor\n')
+      self.assertEqual(SysfsEntry(self.impl, 'temp1_label').read(), 'Board sensor')
+
+   def testShared(self):
+      entry = SysfsEntryFloat(self.impl, 'in1_input')
+      self.assertIs(SysfsEntryFloat(self.impl, 'in1_input'), entry)
+      self.assertIsNot(SysfsEntryFloat(self.impl, 'in1_input', scale=1.), entry)
+      self.assertIsNot(SysfsEntry(self.impl, 'in1_input'), entry)
+      self.assertIsNot(SysfsEntryFloat(self.impl, 'in2_input'), entry)
+      impl = MockSysfsImpl(MockHwmonDriver(self.path))
+      self.assertIsNot(SysfsEntryFloat(impl, 'in1_input'), entry)
+
+   def testCustomLed(self):
+      path = os.path.join(self.path, 'leds', 'status')
+      os.makedirs(path)
+      self._writeFile(os.path.join(path, 'brightness'), '0\n')
+      led = SysfsEntryCustomLed(self.impl, 'status')
+      self.assertEqual(led.entryPath, os.path.join(path, 'brightness'))
+      self.assertTrue(led.write(LedColor.RED))
+      self.assertEqual(led.read(), LedColor.RED)
+      self.assertIs(SysfsEntryCustomLed(self.impl, 'status'), led)
+      with self.assertRaises(KeyError):
+         led.write(LedColor.BLUE)
+      with self.assertRaises(KeyError):
+         led.write(None)
+
+   def testCustomLedValues(self):
+      path = os.path.join(self.path, 'leds', 'status')
+      os.makedirs(path)
+      self._writeFile(os.path.join(path, 'brightness'), '0\n')
+      led = SysfsEntryCustomLed(self.impl, 'status', value2color={
+         0: LedColor.OFF,
+         2: LedColor.BLUE,
+      })
+      self.assertTrue(led.write(LedColor.BLUE))
+      self.assertEqual(led.read(), LedColor.BLUE)
+      with open(os.path.join(path, 'brightness')) as f:
+         self.assertEqual(int(f.read()), 2)
+
+class FanSysfsImplTest(SysfsTestBase):
+   def testSetSpeedSkipsUnchanged(self):
+      self._writeFile('pwm1', '0\n')
+      fan = FanSysfsImpl(self.impl.driver, FanDesc(fanId=1))
+      self.assertTrue(fan.setSpeed(30))
+      self.assertEqual(fan.getSpeed(), 29)
+      with patch.object(fan.pwm, 'write') as write:
+         self.assertTrue(fan.setSpeed(30))
+         write.assert_not_called()
+
+   @patch('arista.core.driver.kernel.sysfs.logging')
+   def testSetSpeedRestoresReset(self, logging):
+      self._writeFile('pwm1', '0\n')
+      fan = FanSysfsImpl(self.impl.driver, FanDesc(fanId=1))
+      self.assertTrue(fan.setSpeed(100))
+      self.assertEqual(fan.getSpeed(), 100)
+      self.assertEqual(logging.warning.call_count, 1)
+      self._writeFile('pwm1', '0\n')
+      self.assertTrue(fan.setSpeed(100))
+      self.assertEqual(fan.getSpeed(), 100)
+      self.assertEqual(logging.warning.call_count, 1)
+      logging.debug.assert_not_called()
+      self.assertTrue(fan.setSpeed(60))
+      self.assertEqual(fan.getSpeed(), 60)
+      logging.debug.assert_called_once()
+
+   def testSetSpeedReadFailure(self):
+      self._writeFile('pwm1', '0\n')
+      fan = FanSysfsImpl(self.impl.driver, FanDesc(fanId=1))
+      self.assertTrue(fan.setSpeed(100))
+      with patch.object(fdCache, 'read', side_effect=OSError(errno.EIO, 'EIO')), \
+           patch.object(fan.pwm, 'write', return_value=True) as write:
+         self.assertTrue(fan.setSpeed(100))
+         write.assert_called_once_with(100)
+
+class TempSysfsImplTest(SysfsTestBase):
+   def testRefreshHardwareThresholds(self):
+      self._writeFile('temp1_max', '0\n')
+      self._writeFile('temp1_crit', '0\n')
+      desc = SensorDesc(diode=0, overheat=80, critical=90)
+      temp = TempSysfsImpl(self.impl.driver, desc)
+      temp.refreshHardwareThresholds()
+      self.assertEqual(temp.max.read(), 80.)
+      self.assertEqual(temp.crit.read(), 90.)
+      self.assertFalse(temp.min.exists())
+      self.assertFalse(temp.lcrit.exists())
+
+class RailSysfsImplTest(SysfsTestBase):
+   def _testRail(self, cls):
+      self._writeFile('in1_input', '12000\n')
+      self._writeFile('power1_input', '60000000\n')
+      rail = cls(self.impl.driver, RailDesc(railId=1, name='rail1'))
+      self.assertEqual(rail.getVoltage(), 12.)
+      self.assertEqual(rail.getPower(), 60.)
+      self.assertEqual(rail.getCurrent(), 5.)
+      self._writeFile('power1_input', '120000000\n')
+      getHwmonBatchReader(self.path).invalidate()
+      self.assertEqual(rail.getCurrent(), 10.)
+
+   def testRailSharedEntries(self):
+      desc = RailDesc(railId=1, name='rail1')
+      raw = RailSysfsRawImpl(self.impl.driver, desc)
+      rail = RailSysfsImpl(self.impl.driver, desc)
+      self.assertIs(raw.voltage, rail.voltage.input)
+      self.assertIs(raw.current, rail.current.input)
+      self.assertIs(raw.power, rail.power.input)
+
+   def testRailRaw(self):
+      self._testRail(RailSysfsRawImpl)
+
+   def testRail(self):
+      self._testRail(RailSysfsImpl)
+
+   def testRailNotBound(self):
+      impl = MockSysfsImpl(MockHwmonDriver(os.path.join(self.path, 'unbound')))
+      rail = RailSysfsRawImpl(impl.driver, RailDesc(railId=1, name='rail1'))
+      self.assertEqual(rail.getCurrent(), 0)
+      os.makedirs(impl.driver.path)
+      with open(os.path.join(impl.driver.path, 'curr1_input'), 'w') as f:
+         f.write('3000\n')
+      self.assertEqual(rail.getCurrent(), 3.)
+
+   def _testRailRemoved(self, cls):
+      self._writeFile('curr1_input', '3000\n')
+      rail = cls(self.impl.driver, RailDesc(railId=1, name='rail1'))
+      self.assertEqual(rail.getCurrent(), 3.)
+      self.assertIn('getCurrent', rail.__dict__)
+      # NOTE: removed sysfs attributes fail with ENODEV on open descriptors
+      getHwmonBatchReader(self.path).invalidate()
+      with patch.object(SysfsFdCache, 'read',
+                        side_effect=OSError(errno.ENODEV, 'ENODEV')):
+         self.assertEqual(rail.getCurrent(), 0)
+      self.assertNotIn('getCurrent', rail.__dict__)
+      self._writeFile('curr1_input', '4000\n')
+      getHwmonBatchReader(self.path).invalidate()
+      self.assertEqual(rail.getCurrent(), 4.)
+
+   def testRailRawRemoved(self):
+      self._testRailRemoved(RailSysfsRawImpl)
+
+   def testRailRemoved(self):
+      self._testRailRemoved(RailSysfsImpl)
+
+if __name__ == '__main__':
+   unittest.main()
@@ -48,9 +48,27 @@ class PciAddr(SysfsPath):
       self.bus = bus
       self.device = device
       self.func = func
+      self.strCache = None
 
    def __str__(self):
-      return '%04x:%02x:%02x.%d' % (self.domain, self.bus, self.device, self.func)
+      # NOTE: the fields can be modified after creation (e.g copies offset by a
+      #       slot), the cached string is only reused for the same fields
+      key = self.__key()
+      if self.strCache is None or self.strCache[0] != key:
+         self.strCache = (key, '%04x:%02x:%02x.%d' % key)
+      return self.strCache[1]
+
+   def __key(self):
+      return (self.domain, self.bus, self.device, self.func)
+
+   def __eq__(self, other):
+      return isinstance(other, PciAddr) and self.__key() == other.__key()
+
+   def __ne__(self, other):
+      return not self == other
+
+   def __hash__(self):
+      return hash(self.__key())
 
    def getSysfsPath(self):
       return os.path.join('/sys/bus/pci/devices', str(self))
@@ -418,12 +418,25 @@ simulation = True
 # simulation related globals
 SMBus = None
 
+# callbacks invoked with the simulation state whenever it is set
+simulationHooks = []
+
 def inDebug():
    return debug
 
 def inSimulation():
    return simulation
 
+def setSimulation(value):
+   global simulation
+   simulation = value
+   for hook in simulationHooks:
+      hook(value)
+
+def registerSimulationHook(hook):
+   simulationHooks.append(hook)
+   hook(simulation)
+
 def runningInContainer():
    # Docker containers by default have this path.
    return os.path.exists("/.dockerenv")
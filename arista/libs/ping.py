@@ -1,11 +1,83 @@
 
 import os
+import select
+import socket
+import struct
 import subprocess
 
-def ping(address):
-   cmd = ['ping', '-c', '1', '-W', '1', address]
+from .python import monotonicRaw
+
+ICMP_ECHO_REPLY = 0
+ICMP_ECHO_REQUEST = 8
+ICMP_HEADER = struct.Struct('!BBHHH')
+ICMP_PAYLOAD = b'arista-ping'
+
+def icmpChecksum(data):
+   if len(data) % 2:
+      data += b'\0'
+   total = sum(struct.unpack('!%dH' % (len(data) // 2), data))
+   total = (total >> 16) + (total & 0xffff)
+   total += total >> 16
+   return ~total & 0xffff
+
+def icmpSocket():
+   # NOTE: datagram ICMP sockets don't need any privilege but are only allowed
+   #       for the groups in net.ipv4.ping_group_range, raw ones need
+   #       CAP_NET_RAW
+   for sockType in (socket.SOCK_DGRAM, socket.SOCK_RAW):
+      try:
+         return socket.socket(socket.AF_INET, sockType, socket.IPPROTO_ICMP), \
+                sockType
+      except OSError:
+         pass
+   return None, None
+
+def icmpPing(sock, sockType, address, timeout):
+   ident = os.getpid() & 0xffff
+   seq = 1
+   header = ICMP_HEADER.pack(ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+   checksum = icmpChecksum(header + ICMP_PAYLOAD)
+   packet = ICMP_HEADER.pack(ICMP_ECHO_REQUEST, 0, checksum, ident, seq)
+   sock.sendto(packet + ICMP_PAYLOAD, (address, 0))
+
+   deadline = monotonicRaw() + timeout
+   while True:
+      remaining = deadline - monotonicRaw()
+      if remaining <= 0:
+         return False
+      ready, _, _ = select.select([sock], [], [], remaining)
+      if not ready:
+         return False
+      data, (source, _) = sock.recvfrom(1024)
+      if sockType == socket.SOCK_RAW:
+         # NOTE: raw sockets also return the ip header and every icmp packet
+         #       received by the host
+         data = data[(data[0] & 0xf) * 4:]
+      if source != address or len(data) < ICMP_HEADER.size:
+         continue
+      icmpType, _, _, replyIdent, replySeq = ICMP_HEADER.unpack_from(data)
+      if icmpType != ICMP_ECHO_REPLY or replySeq != seq:
+         continue
+      # NOTE: the kernel picks the identifier of datagram sockets
+      if sockType == socket.SOCK_RAW and replyIdent != ident:
+         continue
+      return True
+
+def subprocessPing(address, timeout):
+   cmd = ['ping', '-c', '1', '-W', str(int(timeout)), address]
    try:
       with open(os.devnull, 'wb') as devnull:
          return subprocess.call(cmd, stdout=devnull, stderr=devnull) == 0
    except subprocess.CalledProcessError:
       return False
+
+def ping(address, timeout=1):
+   sock, sockType = icmpSocket()
+   if sock is None:
+      return subprocessPing(address, timeout)
+   try:
+      return icmpPing(sock, sockType, address, timeout)
+   except OSError:
+      return False
+   finally:
+      sock.close()
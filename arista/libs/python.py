@@ -28,3 +28,17 @@ else:
       return time.clock_gettime(time.CLOCK_MONOTONIC_RAW)
 
    makedirs = os.makedirs
+
+class cachedProperty(object):
+   '''Non-data descriptor computing the value once and storing it in the
+      instance __dict__ so that subsequent accesses are plain attribute loads'''
+   def __init__(self, func):
+      self.func = func
+      self.name = func.__name__
+      self.__doc__ = func.__doc__
+
+   def __get__(self, obj, cls=None):
+      if obj is None:
+         return self
+      value = obj.__dict__[self.name] = self.func(obj)
+      return value
@@ -0,0 +1,108 @@
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import socket
+
+from ...tests.testing import unittest, patch
+
+from .. import ping as pinglib
+from ..ping import (
+   ICMP_ECHO_REPLY,
+   ICMP_ECHO_REQUEST,
+   ICMP_HEADER,
+   ICMP_PAYLOAD,
+   icmpChecksum,
+   icmpPing,
+   ping,
+)
+
+ADDRESS = '127.100.3.1'
+
+def icmpPacket(icmpType=ICMP_ECHO_REPLY, ident=None, seq=1, ipHeaderLen=0):
+   ident = os.getpid() & 0xffff if ident is None else ident
+   header = ICMP_HEADER.pack(icmpType, 0, 0, ident, seq)
+   ipHeader = b''
+   if ipHeaderLen:
+      ipHeader = bytes([0x40 | ipHeaderLen // 4]) + b'\0' * (ipHeaderLen - 1)
+   return ipHeader + header + ICMP_PAYLOAD
+
+class FakeSocket(object):
+   def __init__(self, replies=None):
+      self.replies = list(replies or [])
+      self.sent = []
+
+   def sendto(self, data, address):
+      self.sent.append((data, address))
+
+   def recvfrom(self, size):
+      return self.replies.pop(0)
+
+def fakeSelect(rlist, wlist, xlist, timeout):
+   ready = [sock for sock in rlist if sock.replies]
+   return ready, [], []
+
+@patch.object(pinglib.select, 'select', fakeSelect)
+class IcmpPingTest(unittest.TestCase):
+   def testChecksum(self):
+      # NOTE: example from RFC 1071
+      self.assertEqual(icmpChecksum(b'\x00\x01\xf2\x03\xf4\xf5\xf6\xf7'),
+                       0x220d)
+      self.assertEqual(icmpChecksum(b'\x00\x01\xf2'), 0x0dfe)
+
+   def testRequest(self):
+      sock = FakeSocket([(icmpPacket(), (ADDRESS, 0))])
+      self.assertTrue(icmpPing(sock, socket.SOCK_DGRAM, ADDRESS, 1))
+      (data, address), = sock.sent
+      self.assertEqual(address, (ADDRESS, 0))
+      self.assertEqual(data[0], ICMP_ECHO_REQUEST)
+      self.assertEqual(icmpChecksum(data), 0)
+
+   def testRawHeaderOffset(self):
+      for ipHeaderLen in (20, 24):
+         sock = FakeSocket([
+            (icmpPacket(ipHeaderLen=ipHeaderLen), (ADDRESS, 0)),
+         ])
+         self.assertTrue(icmpPing(sock, socket.SOCK_RAW, ADDRESS, 1))
+
+   def testSkipNonMatching(self):
+      ident = os.getpid() & 0xffff
+      sock = FakeSocket([
+         (icmpPacket(ipHeaderLen=20), ('127.100.4.1', 0)),
+         (icmpPacket(ipHeaderLen=20, seq=2), (ADDRESS, 0)),
+         (icmpPacket(ipHeaderLen=20, ident=ident ^ 1), (ADDRESS, 0)),
+         (icmpPacket(ICMP_ECHO_REQUEST, ipHeaderLen=20), (ADDRESS, 0)),
+         (b'\x45' + b'\0' * 21, (ADDRESS, 0)),
+      ])
+      self.assertFalse(icmpPing(sock, socket.SOCK_RAW, ADDRESS, 1))
+      self.assertFalse(sock.replies)
+      sock.replies.append((icmpPacket(ipHeaderLen=20), (ADDRESS, 0)))
+      self.assertTrue(icmpPing(sock, socket.SOCK_RAW, ADDRESS, 1))
+
+   def testDgramIdentFromKernel(self):
+      ident = os.getpid() & 0xffff
+      sock = FakeSocket([(icmpPacket(ident=ident ^ 1), (ADDRESS, 0))])
+      self.assertTrue(icmpPing(sock, socket.SOCK_DGRAM, ADDRESS, 1))
+
+   def testTimeout(self):
+      sock = FakeSocket()
+      self.assertFalse(icmpPing(sock, socket.SOCK_DGRAM, ADDRESS, 1))
+
+   @patch.object(pinglib, 'monotonicRaw')
+   def testDeadline(self, monotonicRaw):
+      monotonicRaw.side_effect = [0., 0.5, 2.]
+      sock = FakeSocket([(icmpPacket(seq=2), (ADDRESS, 0))] * 2)
+      self.assertFalse(icmpPing(sock, socket.SOCK_DGRAM, ADDRESS, 1))
+      self.assertEqual(len(sock.replies), 1)
+
+class PingTest(unittest.TestCase):
+   @patch.object(pinglib, 'subprocessPing', return_value=True)
+   @patch('socket.socket', side_effect=PermissionError)
+   def testSubprocessFallback(self, sock, subprocessPing):
+      self.assertTrue(ping(ADDRESS))
+      self.assertEqual([c[0][1] for c in sock.call_args_list],
+                       [socket.SOCK_DGRAM, socket.SOCK_RAW])
+      subprocessPing.assert_called_once_with(ADDRESS, 1)
+
+if __name__ == '__main__':
+   unittest.main()
@@ -1,7 +1,6 @@
 from ..core.fixed import FixedSystem
 from ..core.platform import registerPlatform
 from ..core.port import PortLayout
-from ..core.psu import PsuSlot
 from ..core.types import PciAddr
 from ..core.utils import incrange
 
@@ -21,6 +20,56 @@ from .chassis.tuba import Tuba
 
 from .cpu.lorikeet import LorikeetCpu
 
+_MAX6581_SENSORS = (
+   SensorDesc(diode=0, name='Board sensor',
+              position=Position.OTHER, target=85, overheat=95, critical=105),
+   SensorDesc(diode=1, name='Switch board middle sensor',
+              position=Position.OTHER, target=85, overheat=95, critical=105),
+   SensorDesc(diode=2, name='Switch board left sensor',
+              position=Position.OTHER, target=85, overheat=95, critical=105),
+   SensorDesc(diode=3, name='Front-panel temp sensor',
+              position=Position.INLET, target=85, overheat=95, critical=105),
+   SensorDesc(diode=6, name='Switch chip diode 1 sensor',
+              position=Position.OTHER, target=85, overheat=95, critical=105),
+   SensorDesc(diode=7, name='Switch chip diode 2 sensor',
+              position=Position.OTHER, target=85, overheat=95, critical=105),
+)
+
+_LM73_SENSORS = (
+   SensorDesc(diode=0, name='Front-panel temp sensor',
+              position=Position.OTHER, target=65, overheat=75, critical=85),
+)
+
+_RESETS = (
+   ResetDesc('phy3_reset', addr=0x4000, bit=7),
+   ResetDesc('phy2_reset', addr=0x4000, bit=6),
+   ResetDesc('phy1_reset', addr=0x4000, bit=5),
+   ResetDesc('phy0_reset', addr=0x4000, bit=4),
+   ResetDesc('switch_chip_pcie_reset', addr=0x4000, bit=3),
+   ResetDesc('switch_chip_reset', addr=0x4000, bit=2),
+)
+
+_GPIOS = (
+   GpioDesc("psu1_present", 0x5000, 0, ro=True),
+   GpioDesc("psu2_present", 0x5000, 1, ro=True),
+   GpioDesc("psu1_status", 0x5000, 8, ro=True),
+   GpioDesc("psu2_status", 0x5000, 9, ro=True),
+   GpioDesc("psu1_ac_status", 0x5000, 10, ro=True),
+   GpioDesc("psu2_ac_status", 0x5000, 11, ro=True),
+)
+
+def _osfpLedAddrOffset(_):
+   return 0x10
+
+def _sfpLedAddrOffset(_):
+   return 0x40
+
+def _osfpIntrRegIdx(xcvrId):
+   return xcvrId // 33 + 1
+
+def _osfpIntrBit(xcvrId):
+   return (xcvrId - 1) & 31
+
 @registerPlatform()
 class CatalinaP(FixedSystem):
 
@@ -58,25 +107,10 @@ class CatalinaP(FixedSystem):
 
       scd.createWatchdog()
 
-      scd.newComponent(Max6581, addr=scd.i2cAddr(8, 0x4d), sensors=[
-         SensorDesc(diode=0, name='Board sensor',
-                    position=Position.OTHER, target=85, overheat=95, critical=105),
-         SensorDesc(diode=1, name='Switch board middle sensor',
-                    position=Position.OTHER, target=85, overheat=95, critical=105),
-         SensorDesc(diode=2, name='Switch board left sensor',
-                    position=Position.OTHER, target=85, overheat=95, critical=105),
-         SensorDesc(diode=3, name='Front-panel temp sensor',
-                    position=Position.INLET, target=85, overheat=95, critical=105),
-         SensorDesc(diode=6, name='Switch chip diode 1 sensor',
-                    position=Position.OTHER, target=85, overheat=95, critical=105),
-         SensorDesc(diode=7, name='Switch chip diode 2 sensor',
-                    position=Position.OTHER, target=85, overheat=95, critical=105),
-      ])
+      scd.newComponent(Max6581, addr=scd.i2cAddr(8, 0x4d),
+                       sensors=_MAX6581_SENSORS)
 
-      scd.newComponent(Lm73, self.scd.i2cAddr(13, 0x48), sensors=[
-         SensorDesc(diode=0, name='Front-panel temp sensor',
-                    position=Position.OTHER, target=65, overheat=75, critical=85),
-      ])
+      scd.newComponent(Lm73, self.scd.i2cAddr(13, 0x48), sensors=_LM73_SENSORS)
 
       scd.addSmbusMasterRange(0x8000, 11, 0x80)
 
@@ -88,23 +122,9 @@ class CatalinaP(FixedSystem):
          (0x6090, 'beacon'),
       ])
 
-      scd.addResets([
-         ResetDesc('phy3_reset', addr=0x4000, bit=7),
-         ResetDesc('phy2_reset', addr=0x4000, bit=6),
-         ResetDesc('phy1_reset', addr=0x4000, bit=5),
-         ResetDesc('phy0_reset', addr=0x4000, bit=4),
-         ResetDesc('switch_chip_pcie_reset', addr=0x4000, bit=3),
-         ResetDesc('switch_chip_reset', addr=0x4000, bit=2),
-      ])
+      scd.addResets(_RESETS)
 
-      scd.addGpios([
-         GpioDesc("psu1_present", 0x5000, 0, ro=True),
-         GpioDesc("psu2_present", 0x5000, 1, ro=True),
-         GpioDesc("psu1_status", 0x5000, 8, ro=True),
-         GpioDesc("psu2_status", 0x5000, 9, ro=True),
-         GpioDesc("psu1_ac_status", 0x5000, 10, ro=True),
-         GpioDesc("psu2_ac_status", 0x5000, 11, ro=True),
-      ])
+      scd.addGpios(_GPIOS)
 
       intrRegs = [
          scd.createInterrupt(addr=0x3000, num=0),
@@ -118,10 +138,10 @@ class CatalinaP(FixedSystem):
          addr=0xA000,
          bus=24,
          ledAddr=0x6100,
-         ledAddrOffsetFn=lambda x: 0x10,
+         ledAddrOffsetFn=_osfpLedAddrOffset,
          intrRegs=intrRegs,
-         intrRegIdxFn=lambda xcvrId: xcvrId // 33 + 1,
-         intrBitFn=lambda xcvrId: (xcvrId - 1) % 32
+         intrRegIdxFn=_osfpIntrRegIdx,
+         intrBitFn=_osfpIntrBit
       )
 
       scd.addSfpSlotBlock(
@@ -129,26 +149,14 @@ class CatalinaP(FixedSystem):
          addr=0xA900,
          bus=88,
          ledAddr=0x6900,
-         ledAddrOffsetFn=lambda x: 0x40
+         ledAddrOffsetFn=_sfpLedAddrOffset
       )
 
       # PSU
       for psuId, bus in [(1, 12), (2, 11)]:
-         addrFunc=lambda addr, bus=bus: \
-                  scd.i2cAddr(bus, addr, t=3, datr=2, datw=3)
-         name = "psu%d" % psuId
-         scd.newComponent(
-            PsuSlot,
-            slotId=psuId,
-            addrFunc=addrFunc,
-            presentGpio=scd.inventory.getGpio("%s_present" % name),
-            inputOkGpio=scd.inventory.getGpio("%s_ac_status" % name),
-            outputOkGpio=scd.inventory.getGpio("%s_status" % name),
-            led=scd.inventory.getLed('%s' % name),
-            psus=[
-               PS2242,
-            ],
-         )
+         scd.addPsuSlot(psuId, bus, psus=[
+            PS2242,
+         ])
 
       scd.addMdioMasterRange(0x9000, 4)
 
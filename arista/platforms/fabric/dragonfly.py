@@ -5,6 +5,28 @@ from ...descs.sensor import SensorDesc, Position
 
 from .eldridge import Eldridge
 
+_TMP464_0x48_SENSORS = (
+   SensorDesc(diode=0, name='Board sensor 1',
+              position=Position.OTHER, target=75, overheat=85, critical=95),
+   SensorDesc(diode=1, name='Ramon 0 PCB',
+              position=Position.OTHER, target=70, overheat=80, critical=90),
+   SensorDesc(diode=2, name='Ramon 1 PCB',
+              position=Position.OTHER, target=70, overheat=80, critical=90),
+   SensorDesc(diode=4, name='Inlet',
+              position=Position.INLET, target=75, overheat=85, critical=95),
+)
+
+_TMP464_0x49_SENSORS = (
+   SensorDesc(diode=0, name='Board sensor 2',
+              position=Position.OTHER, target=75, overheat=85, critical=95),
+   SensorDesc(diode=1, name='Exhaust',
+              position=Position.OUTLET, target=75, overheat=85, critical=95),
+   SensorDesc(diode=2, name='Ramon 0 Core (secondary)',
+              position=Position.OTHER, target=75, overheat=85, critical=95),
+   SensorDesc(diode=3, name='Ramon 1 Core (secondary)',
+              position=Position.OTHER, target=75, overheat=85, critical=95),
+)
+
 @registerPlatform()
 class Dragonfly(Eldridge):
    SID = ['Dragonfly']
@@ -16,23 +38,7 @@ class Dragonfly(Eldridge):
    }
 
    def createStandbySensors(self):
-      self.pca.newComponent(Tmp464, self.pca.i2cAddr(0x48), sensors=[
-         SensorDesc(diode=0, name='Board sensor 1',
-                    position=Position.OTHER, target=75, overheat=85, critical=95),
-         SensorDesc(diode=1, name='Ramon 0 PCB',
-                    position=Position.OTHER, target=70, overheat=80, critical=90),
-         SensorDesc(diode=2, name='Ramon 1 PCB',
-                    position=Position.OTHER, target=70, overheat=80, critical=90),
-         SensorDesc(diode=4, name='Inlet',
-                    position=Position.INLET, target=75, overheat=85, critical=95),
-      ])
-      self.pca.newComponent(Tmp464, self.pca.i2cAddr(0x49), sensors=[
-         SensorDesc(diode=0, name='Board sensor 2',
-                    position=Position.OTHER, target=75, overheat=85, critical=95),
-         SensorDesc(diode=1, name='Exhaust',
-                    position=Position.OUTLET, target=75, overheat=85, critical=95),
-         SensorDesc(diode=2, name='Ramon 0 Core (secondary)',
-                    position=Position.OTHER, target=75, overheat=85, critical=95),
-         SensorDesc(diode=3, name='Ramon 1 Core (secondary)',
-                    position=Position.OTHER, target=75, overheat=85, critical=95),
-      ])
+      self.pca.newComponent(Tmp464, self.pca.i2cAddr(0x48),
+                            sensors=_TMP464_0x48_SENSORS)
+      self.pca.newComponent(Tmp464, self.pca.i2cAddr(0x49),
+                            sensors=_TMP464_0x49_SENSORS)
@@ -17,6 +17,56 @@ from ...descs.sensor import SensorDesc, Position
 
 from ...drivers.pca9555 import GpioRegister
 
+_TMP468_SENSORS = (
+   SensorDesc(diode=0, name='Board sensor 1',
+              position=Position.OTHER, target=75, overheat=85, critical=95),
+   SensorDesc(diode=1, name='Ramon 0 PCB',
+              position=Position.OTHER, target=70, overheat=80, critical=90),
+   SensorDesc(diode=2, name='Ramon 1 PCB',
+              position=Position.OTHER, target=70, overheat=80, critical=90),
+   SensorDesc(diode=3, name='Ramon 2 PCB',
+              position=Position.OTHER, target=70, overheat=80, critical=90),
+   SensorDesc(diode=4, name='Inlet',
+              position=Position.INLET, target=75, overheat=85, critical=95),
+   SensorDesc(diode=5, name='Exhaust',
+              position=Position.OUTLET, target=75, overheat=85, critical=95),
+   SensorDesc(diode=7, name='Ramon 0 Core (secondary)',
+              position=Position.OTHER, target=75, overheat=85, critical=95),
+   SensorDesc(diode=8, name='Ramon 1 Core (secondary)',
+              position=Position.OTHER, target=75, overheat=85, critical=95),
+)
+
+_MAX6658_SENSORS = (
+   SensorDesc(diode=0, name='Ramon 2 Core (secondary)',
+              position=Position.OTHER, target=75, overheat=85, critical=95),
+)
+
+_TMP464_0x48_SENSORS = (
+   SensorDesc(diode=0, name='Board sensor 1',
+              position=Position.OTHER, target=75, overheat=85, critical=95),
+   SensorDesc(diode=1, name='Ramon 0 PCB',
+              position=Position.OTHER, target=70, overheat=80, critical=90),
+   SensorDesc(diode=2, name='Ramon 1 PCB',
+              position=Position.OTHER, target=70, overheat=80, critical=90),
+   SensorDesc(diode=3, name='Ramon 2 PCB',
+              position=Position.OTHER, target=70, overheat=80, critical=90),
+   SensorDesc(diode=4, name='Inlet',
+              position=Position.INLET, target=75, overheat=85, critical=95),
+)
+
+_TMP464_0x49_SENSORS = (
+   SensorDesc(diode=0, name='Board sensor 2',
+              position=Position.OTHER, target=75, overheat=85, critical=95),
+   SensorDesc(diode=1, name='Exhaust',
+              position=Position.OUTLET, target=75, overheat=85, critical=95),
+   SensorDesc(diode=2, name='Ramon 0 Core (secondary)',
+              position=Position.OTHER, target=75, overheat=85, critical=95),
+   SensorDesc(diode=3, name='Ramon 1 Core (secondary)',
+              position=Position.OTHER, target=75, overheat=85, critical=95),
+   SensorDesc(diode=4, name='Ramon 2 Core (secondary)',
+              position=Position.OTHER, target=75, overheat=85, critical=95),
+)
+
 class Gpio2Registers(RegisterMap):
    A = GpioRegister(0x0,
       RegBitField(0, 'fanFault1', ro=False),
@@ -83,10 +133,12 @@ class Eldridge(DenaliFabric):
    def createStandbyFansForChip(self, chip, begin, end):
       for i, slotId in enumerate(incrange(begin, end)):
          led = self.gpio2.addGpioLed('fanFault%d' % slotId)
-         chip.addFan(FanDesc(fanId=i * 2 + 1, position=FanPosition.INLET,
-                             airflow=Airflow.EXHAUST), led=led)
-         chip.addFan(FanDesc(fanId=i * 2 + 2, position=FanPosition.OUTLET,
-                             airflow=Airflow.EXHAUST), led=led)
+         chip.addFans([
+            FanDesc(fanId=i * 2 + 1, position=FanPosition.INLET,
+                    airflow=Airflow.EXHAUST),
+            FanDesc(fanId=i * 2 + 2, position=FanPosition.OUTLET,
+                    airflow=Airflow.EXHAUST),
+         ], led=led)
 
    def createStandbyFans(self):
       chip1 = self.pca.newComponent(Max31790, self.pca.i2cAddr(0x2d),
@@ -97,58 +149,20 @@ class Eldridge(DenaliFabric):
       self.createStandbyFansForChip(chip2, 5, 8)
 
    def createOldStandbySensors(self):
-      self.pca.newComponent(Tmp468, self.pca.i2cAddr(0x48), sensors=[
-         SensorDesc(diode=0, name='Board sensor 1',
-                    position=Position.OTHER, target=75, overheat=85, critical=95),
-         SensorDesc(diode=1, name='Ramon 0 PCB',
-                    position=Position.OTHER, target=70, overheat=80, critical=90),
-         SensorDesc(diode=2, name='Ramon 1 PCB',
-                    position=Position.OTHER, target=70, overheat=80, critical=90),
-         SensorDesc(diode=3, name='Ramon 2 PCB',
-                    position=Position.OTHER, target=70, overheat=80, critical=90),
-         SensorDesc(diode=4, name='Inlet',
-                    position=Position.INLET, target=75, overheat=85, critical=95),
-         SensorDesc(diode=5, name='Exhaust',
-                    position=Position.OUTLET, target=75, overheat=85, critical=95),
-         SensorDesc(diode=7, name='Ramon 0 Core (secondary)',
-                    position=Position.OTHER, target=75, overheat=85, critical=95),
-         SensorDesc(diode=8, name='Ramon 1 Core (secondary)',
-                    position=Position.OTHER, target=75, overheat=85, critical=95),
-      ])
-      self.pca.newComponent(Max6658, self.pca.i2cAddr(0x4c), sensors=[
-         SensorDesc(diode=0, name='Ramon 2 Core (secondary)',
-                    position=Position.OTHER, target=75, overheat=85, critical=95),
-      ])
+      self.pca.newComponent(Tmp468, self.pca.i2cAddr(0x48),
+                            sensors=_TMP468_SENSORS)
+      self.pca.newComponent(Max6658, self.pca.i2cAddr(0x4c),
+                            sensors=_MAX6658_SENSORS)
 
    def createStandbySensors(self):
       if self.getHwApi() < HwApi(42):
          self.createOldStandbySensors()
          return
 
-      self.pca.newComponent(Tmp464, self.pca.i2cAddr(0x48), sensors=[
-         SensorDesc(diode=0, name='Board sensor 1',
-                    position=Position.OTHER, target=75, overheat=85, critical=95),
-         SensorDesc(diode=1, name='Ramon 0 PCB',
-                    position=Position.OTHER, target=70, overheat=80, critical=90),
-         SensorDesc(diode=2, name='Ramon 1 PCB',
-                    position=Position.OTHER, target=70, overheat=80, critical=90),
-         SensorDesc(diode=3, name='Ramon 2 PCB',
-                    position=Position.OTHER, target=70, overheat=80, critical=90),
-         SensorDesc(diode=4, name='Inlet',
-                    position=Position.INLET, target=75, overheat=85, critical=95),
-      ])
-      self.pca.newComponent(Tmp464, self.pca.i2cAddr(0x49), sensors=[
-         SensorDesc(diode=0, name='Board sensor 2',
-                    position=Position.OTHER, target=75, overheat=85, critical=95),
-         SensorDesc(diode=1, name='Exhaust',
-                    position=Position.OUTLET, target=75, overheat=85, critical=95),
-         SensorDesc(diode=2, name='Ramon 0 Core (secondary)',
-                    position=Position.OTHER, target=75, overheat=85, critical=95),
-         SensorDesc(diode=3, name='Ramon 1 Core (secondary)',
-                    position=Position.OTHER, target=75, overheat=85, critical=95),
-         SensorDesc(diode=4, name='Ramon 2 Core (secondary)',
-                    position=Position.OTHER, target=75, overheat=85, critical=95),
-      ])
+      self.pca.newComponent(Tmp464, self.pca.i2cAddr(0x48),
+                            sensors=_TMP464_0x48_SENSORS)
+      self.pca.newComponent(Tmp464, self.pca.i2cAddr(0x49),
+                            sensors=_TMP464_0x49_SENSORS)
 
    def powerStandbyDomainIs(self, on):
       super(Eldridge, self).powerStandbyDomainIs(on)
@@ -1,7 +1,6 @@
 from ..core.fixed import FixedSystem
 from ..core.platform import registerPlatform
 from ..core.port import PortLayout
-from ..core.psu import PsuSlot
 from ..core.types import PciAddr
 from ..core.utils import incrange
 
@@ -84,22 +83,10 @@ class Lodoga(FixedSystem):
       ])
 
       for psuId in incrange(1, 2):
-         addrFunc=lambda addr, i=psuId: \
-                  scd.i2cAddr(10 + i, addr, t=3, datr=2, datw=3)
-         name = "psu%d" % psuId
-         scd.newComponent(
-            PsuSlot,
-            slotId=psuId,
-            addrFunc=addrFunc,
-            presentGpio=scd.inventory.getGpio("%s_present" % name),
-            inputOkGpio=scd.inventory.getGpio("%s_ac_status" % name),
-            outputOkGpio=scd.inventory.getGpio("%s_status" % name),
-            led=scd.inventory.getLed(name),
-            psus=[
-               DPS495CB,
-               DS495SPE,
-            ],
-         )
+         scd.addPsuSlot(psuId, 10 + psuId, psus=[
+            DPS495CB,
+            DS495SPE,
+         ])
 
       intrRegs = [
          scd.createInterrupt(addr=0x3000, num=0),
@@ -1,7 +1,6 @@
 from ..core.fixed import FixedSystem
 from ..core.platform import registerPlatform
 from ..core.port import PortLayout
-from ..core.psu import PsuSlot
 from ..core.types import PciAddr
 from ..core.utils import incrange
 
@@ -90,17 +89,9 @@ class Upperlake(FixedSystem):
       ])
 
       for psuId, bus in [(1, 4), (2, 3)]:
-         addrFunc=lambda addr, bus=bus: \
-                  scd.i2cAddr(bus, addr, t=3, datr=2, datw=3)
-         name = "psu%d" % psuId
-         scd.newComponent(
-            PsuSlot,
-            slotId=psuId,
-            addrFunc=addrFunc,
-            presentGpio=scd.inventory.getGpio("%s_present" % name),
-            inputOkGpio=self.syscpld.inventory.getGpio("%s_ac_status" % name),
-            outputOkGpio=self.syscpld.inventory.getGpio("%s_status" % name),
-            led=scd.inventory.getLed(name),
+         scd.addPsuSlot(
+            psuId, bus,
+            statusInventory=self.syscpld.inventory,
             psus=[
                DPS495CB,
                DPS750AB,
@@ -5,6 +5,7 @@ from __future__ import print_function
 try:
    from arista.core.onie import OnieEeprom
    from arista.libs.ping import ping
+   from arista.libs.python import monotonicRaw
    from arista.utils.sonic_platform.fan import Fan
    from arista.utils.sonic_platform.thermal import Thermal
    from sonic_platform_base.module_base import ModuleBase
@@ -16,32 +17,101 @@ class Module(ModuleBase):
    Platform-specific class for interfacing with a module
    (supervisor module, line card module, etc. applicable for a modular chassis)
    """
+   # NOTE: how long in seconds the presence of the module is reused
+   PRESENCE_CACHE_TTL = 1
+
    def __init__(self, sku):
       ModuleBase.__init__(self)
       self._sku = sku
+      self._slotId = sku.getSlotId()
+      # TODO: will this work from the linecard side? comment is not that clear
+      self._midplaneIp = "127.100.%d.1" % self._slotId
       self._inventory = sku.getInventory()
       self._eeprom = sku.getEeprom()
+      self._sysEepromInfo = None
+      self._asicAddrEpoch = None
+      self._presence = False
+      self._presenceTimestamp = None
+      # NOTE: the fan and thermal objects are only created when first requested
+      self._fansLoaded = False
+      self._thermalsLoaded = False
+      # TODO: Add Xcvrs? Only linecards have access to them
 
-      for fan in self._inventory.getFans():
-         self._fan_list.append(Fan(None, fan))
+   def _loadFans(self):
+      if not self._fansLoaded:
+         # NOTE: the list is created by ModuleBase, extend it in place
+         self._fan_list.extend([Fan(None, fan)
+                                for fan in self._inventory.getFans()])
+         self._fansLoaded = True
+      return self._fan_list
+
+   def _loadThermals(self):
+      if not self._thermalsLoaded:
+         # TODO: index used here to allow thermal.get_position_in_parent() to
+         # return unique values but we want a proper way of uniquely identifying
+         # sensors
+         self._thermal_list.extend([
+            Thermal(index, thermal)
+            for index, thermal in enumerate(self._inventory.getTemps(), 1)
+         ])
+         self._thermalsLoaded = True
+      return self._thermal_list
+
+   def get_num_fans(self):
+      return len(self._loadFans())
+
+   def get_all_fans(self):
+      return self._loadFans()
+
+   def get_fan(self, index):
+      self._loadFans()
+      return ModuleBase.get_fan(self, index)
+
+   def get_num_thermals(self):
+      return len(self._loadThermals())
+
+   def get_all_thermals(self):
+      return self._loadThermals()
+
+   def get_thermal(self, index):
+      self._loadThermals()
+      return ModuleBase.get_thermal(self, index)
+
+   @property
+   def _eepromDict(self):
+      # NOTE: the eeprom can't be read while the module is not inserted,
+      #       get_presence() drops it when the module is seen absent. A module
+      #       swapped within PRESENCE_CACHE_TTL goes unnoticed.
+      if not self.get_presence():
+         return {}
+      if not self._eeprom:
+         self._eeprom = self._sku.getEeprom()
+         self._sysEepromInfo = None
+      return self._eeprom or {}
 
-      # TODO: index used here to allow thermal.get_position_in_parent() to return
-      # unique values but we want a proper way of uniquely identifying sensors
-      for index, thermal in enumerate(self._inventory.getTemps()):
-         self._thermal_list.append(Thermal(index + 1, thermal))
-      # TODO: Add Xcvrs? Only linecards have access to them
+   def _invalidateEeprom(self):
+      self._eeprom = None
+      self._sysEepromInfo = None
 
    def get_presence(self):
-      return self._sku.getPresence()
+      now = monotonicRaw()
+      if self._presenceTimestamp is None or \
+         now - self._presenceTimestamp >= self.PRESENCE_CACHE_TTL:
+         self._presence = self._sku.getPresence()
+         self._presenceTimestamp = now
+         if not self._presence:
+            # NOTE: a different module might be inserted in the slot
+            self._invalidateEeprom()
+      return self._presence
 
    def get_model(self):
-      return self._sku.getEeprom().get('SKU')
+      return self._eepromDict.get('SKU')
 
    def get_serial(self):
-      return self._sku.getEeprom().get('SerialNumber')
+      return self._eepromDict.get('SerialNumber')
 
    def get_revision(self):
-      rev = self._sku.getEeprom().get('HwApi')
+      rev = self._eepromDict.get('HwApi')
       return '.'.join('%02x' % x for x in rev) if rev is not None else rev
 
    def get_status(self):
@@ -52,22 +122,27 @@ class Module(ModuleBase):
       return True
 
    def get_base_mac(self):
-      mac = self._sku.getEeprom().get('MAC')
+      mac = self._eepromDict.get('MAC')
       if mac is None:
          raise NotImplementedError
       return mac
 
    def get_system_eeprom_info(self):
-      return OnieEeprom(self._eeprom).data(filterOut=[0x28])
+      eeprom = self._eepromDict
+      if self._sysEepromInfo is None:
+         self._sysEepromInfo = OnieEeprom(eeprom).data(filterOut=(0x28,))
+      # NOTE: copied so that callers can't alter the cached data
+      return dict(self._sysEepromInfo)
 
    def get_description(self):
-      name = self._sku.getEeprom().get('SKU')
+      eeprom = self._eepromDict
+      name = eeprom.get('SKU')
       if name is not None:
          return name
-      return self._sku.getEeprom().get('SID', 'Unknown')
+      return eeprom.get('SID', 'Unknown')
 
    def get_slot(self):
-      return self._sku.getSlotId()
+      return self._slotId
 
    def get_oper_status(self):
       # TODO: Implement the following modes
@@ -98,26 +173,37 @@ class Module(ModuleBase):
       return True
 
    def get_position_in_parent(self):
-      return self._sku.getSlotId()
+      return self._slotId
 
    def get_midplane_ip(self):
-      # TODO: will this work from the linecard side? comment is not that clear
-      return "127.100.%d.1" % self.get_slot()
+      return self._midplaneIp
 
    def get_all_asics(self):
       return []
 
 class SupervisorModule(Module):
+   NAME_PREFIX = ModuleBase.MODULE_TYPE_SUPERVISOR
+
+   def __init__(self, sku):
+      Module.__init__(self, sku)
+      self._name = self.NAME_PREFIX + str(self._slotId - 1)
+
    def get_name(self):
-      mid = self._sku.getSlotId() - 1
-      return '%s%s' % (self.MODULE_TYPE_SUPERVISOR, mid)
+      return self._name
 
    def get_type(self):
       return self.MODULE_TYPE_SUPERVISOR
 
 class FabricModule(Module):
+   NAME_PREFIX = ModuleBase.MODULE_TYPE_FABRIC
+
+   def __init__(self, sku):
+      Module.__init__(self, sku)
+      self._relSlotId = sku.getRelativeSlotId()
+      self._name = self.NAME_PREFIX + str(self._relSlotId)
+
    def get_name(self):
-      return '%s%s' % (self.MODULE_TYPE_FABRIC, self._sku.getRelativeSlotId())
+      return self._name
 
    def get_type(self):
       return self.MODULE_TYPE_FABRIC
@@ -126,29 +212,47 @@ class FabricModule(Module):
       return False
 
    def get_all_asics(self):
-      self._asic_list = []
       self._sku.updateAsicAddr()
-      starting_index = self._sku.getRelativeSlotId() * len(self._sku.asics)
-      for asic_index, asic in enumerate(self._sku.asics):
-         global_asic_index = starting_index + asic_index
-         self._asic_list.append((global_asic_index, str(asic.addr)))
+      if self._asicAddrEpoch != self._sku.asicAddrEpoch:
+         start = self._relSlotId * len(self._sku.asics)
+         self._asic_list = [(start + index, str(asic.addr))
+                            for index, asic in enumerate(self._sku.asics)]
+         self._asicAddrEpoch = self._sku.asicAddrEpoch
       return self._asic_list
 
 class LinecardModule(Module):
+   NAME_PREFIX = ModuleBase.MODULE_TYPE_LINE
+   # NOTE: how long in seconds the result of a ping is reused
+   PING_CACHE_TTL = 2
+
+   def __init__(self, sku):
+      Module.__init__(self, sku)
+      self._relSlotId = sku.getRelativeSlotId()
+      self._name = self.NAME_PREFIX + str(self._relSlotId)
+      self._pingTimestamp = None
+      self._pingResult = False
+
    def get_name(self):
-      return '%s%s' % (self.MODULE_TYPE_LINE, self._sku.getRelativeSlotId())
+      return self._name
 
    def get_type(self):
       return self.MODULE_TYPE_LINE
 
    def is_midplane_reachable(self):
       if not self.get_presence() or not self._sku.poweredOn():
+         self._pingTimestamp = None
          return False
-      return ping(self.get_midplane_ip())
+      now = monotonicRaw()
+      if self._pingTimestamp is None or \
+         now - self._pingTimestamp >= self.PING_CACHE_TTL:
+         self._pingResult = ping(self._midplaneIp)
+         self._pingTimestamp = now
+      return self._pingResult
 
    def get_all_asics(self):
-      self._asic_list = []
       self._sku.updateAsicAddr()
-      for asic_index, asic in enumerate(self._sku.asics):
-         self._asic_list.append((asic_index, str(asic.addr)))
+      if self._asicAddrEpoch != self._sku.asicAddrEpoch:
+         self._asic_list = [(index, str(asic.addr))
+                            for index, asic in enumerate(self._sku.asics)]
+         self._asicAddrEpoch = self._sku.asicAddrEpoch
       return self._asic_list